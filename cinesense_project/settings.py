@@ -17,8 +17,8 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # SECURITY WARNING: keep the secret key used in production secret!
-# Demonstrates: f-strings with placeholder
-SECRET_KEY = f"django-insecure-cinesense-{''.join(['x' for _ in range(40)])}"
+# Demonstrates: string concatenation and multiplication (folded at compile time)
+SECRET_KEY = "django-insecure-cinesense-" + "x" * 40
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -75,6 +75,16 @@ DATABASES = {
     }
 }
 
+# SQLite tuning, applied to every new connection (see movies.apps).
+# WAL lets reads run alongside writes, and synchronous=NORMAL fsyncs at
+# checkpoints instead of on every commit - much faster bulk writes.
+SQLITE_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',  # negative = size in KiB (~64 MB)
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -151,3 +161,6 @@ LOGOUT_REDIRECT_URL = 'home'
 # External API Configuration
 # OMDB API - Get a free API key at: http://www.omdbapi.com/apikey.aspx
 OMDB_API_KEY = os.environ.get('OMDB_API_KEY', '')  # Set your API key here or via environment variable
+
+# Persistent poster lookup cache used by `manage.py fetch_posters`
+OMDB_POSTER_CACHE = BASE_DIR / '.omdb_cache.sqlite3'
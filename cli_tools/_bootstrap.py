@@ -0,0 +1,39 @@
+"""
+CineSense CLI Tools - Django Bootstrap
+======================================
+
+Shared setup for the standalone CLI scripts: puts the project root on
+sys.path, selects the settings module and runs django.setup() once.
+
+Usage (at the top of a CLI script):
+    if __package__:
+        from . import _bootstrap
+    else:
+        import _bootstrap
+    _bootstrap.setup()
+"""
+
+import os
+import sys
+
+# Project root = parent of the cli_tools directory
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cinesense_project.settings')
+
+
+def setup() -> None:
+    """
+    Configure Django if it is not configured yet.
+
+    Safe to call repeatedly (e.g. from an interactive shell or when the
+    tools are imported by another script): later calls are a no-op.
+    """
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+        django.setup()
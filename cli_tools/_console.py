@@ -0,0 +1,23 @@
+"""
+CineSense CLI Tools - Console Helpers
+=====================================
+
+Prompt reading shared by the CLI scripts.
+"""
+
+import sys
+
+
+def fast_input(prompt: str = "") -> str:
+    """
+    Write a prompt and read one line from stdin.
+
+    Drop-in replacement for input() without its extra stderr flush and
+    empty writes per call. Raises EOFError at end of input, like input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
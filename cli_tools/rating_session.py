@@ -16,18 +16,22 @@ Usage:
     python cli_tools/rating_session.py
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cinesense_project.settings')
-
-import django
-django.setup()
+# Setup Django (shared with the other CLI tools)
+if __package__:
+    from . import _bootstrap
+    from ._console import fast_input
+else:
+    import _bootstrap
+    from _console import fast_input
+_bootstrap.setup()
 
 from movies.models import Movie, Rating
 from django.contrib.auth.models import User
-import random
+from django.db import transaction
+
+# Horizontal rules used by the session output
+_HR50 = "=" * 50
+_HR40 = "=" * 40
 
 
 def get_input(prompt: str, input_type: type = str, default=None):
@@ -43,7 +47,7 @@ def get_input(prompt: str, input_type: type = str, default=None):
         else:
             full_prompt = f"{prompt}: "
         
-        value = input(full_prompt).strip()  # String modification
+        value = fast_input(full_prompt).strip()  # String modification
         
         # Handle empty input
         if not value:
@@ -76,70 +80,75 @@ def rate_random_movies(user: User, count: int = 5):
         Rating.objects.filter(user=user).values_list('movie_id', flat=True)
     )
     
-    # Get unrated movies
+    # Randomly select unrated movies in the database (ORDER BY RANDOM()
+    # LIMIT count), fetching only the fields shown during the session
     unrated = Movie.objects.exclude(pk__in=rated_ids)
-    unrated_list = list(unrated)  # Cast queryset to list
+    movies_to_rate = list(  # Cast queryset to list
+        unrated.only('id', 'title', 'year', 'genres', 'overview').order_by('?')[:count]
+    )
     
-    if len(unrated_list) < count:
-        print(f"Only {len(unrated_list)} unrated movies available.")
-        count = len(unrated_list)
+    if len(movies_to_rate) < count:
+        print(f"Only {len(movies_to_rate)} unrated movies available.")
+        count = len(movies_to_rate)
     
     if count == 0:
         print("You've rated all available movies!")
         return
     
-    # Randomly select movies
-    random.shuffle(unrated_list)
-    movies_to_rate = unrated_list[:count]
-    
     ratings_given = []  # List to track ratings
     
     print(f"\n🎬 Rating Session: {count} movies")
-    print("=" * 50)
-    
-    # For loop over selected movies
-    for i, movie in enumerate(movies_to_rate, 1):
-        print(f"\n[{i}/{count}] {movie.title} ({movie.year})")
-        print(f"Genres: {movie.genres}")
-        if movie.overview:
-            print(f"Overview: {movie.overview[:100]}...")
-        
-        # Options
-        print("\nOptions: rate (0.5-5), skip (s), quit (q)")
-        
-        # While loop for valid input
-        while True:
-            choice = input("Your choice: ").strip().lower()
+    print(_HR50)
+    
+    pending = []  # Unsaved Rating objects
+    
+    try:
+        # For loop over selected movies
+        for i, movie in enumerate(movies_to_rate, 1):
+            print(f"\n[{i}/{count}] {movie.title} ({movie.year})")
+            print(f"Genres: {movie.genres}")
+            if movie.overview:
+                print(f"Overview: {movie.overview[:100]}...")
             
-            if choice == 'q':
-                print("\n👋 Session ended.")
-                return
-            elif choice == 's':
-                print("⏭️ Skipped")
-                break
-            else:
-                # Try to cast to float
-                try:
-                    stars = float(choice)
-                    if 0.5 <= stars <= 5.0:
-                        # Create rating
-                        rating = Rating.objects.create(
-                            user=user,
-                            movie=movie,
-                            stars=stars,
-                        )
-                        ratings_given.append((movie.title, stars))
-                        print(f"✅ Rated {stars:.1f}★")  # f-string with format
-                        break
-                    else:
-                        print("Rating must be between 0.5 and 5.0")
-                except ValueError:
-                    print("Invalid input. Enter a number (0.5-5), 's' to skip, or 'q' to quit.")
+            # Options
+            print("\nOptions: rate (0.5-5), skip (s), quit (q)")
+            
+            # While loop for valid input
+            while True:
+                choice = fast_input("Your choice: ").strip().lower()
+                
+                if choice == 'q':
+                    print("\n👋 Session ended.")
+                    return
+                elif choice == 's':
+                    print("⏭️ Skipped")
+                    break
+                else:
+                    # Try to cast to float
+                    try:
+                        stars = float(choice)
+                        if 0.5 <= stars <= 5.0:
+                            # Queue rating (saved in one batch below)
+                            pending.append(Rating(user=user, movie=movie, stars=stars))
+                            ratings_given.append((movie.title, stars))
+                            print(f"✅ Rated {stars:.1f}★")  # f-string with format
+                            break
+                        else:
+                            print("Rating must be between 0.5 and 5.0")
+                    except ValueError:
+                        print("Invalid input. Enter a number (0.5-5), 's' to skip, or 'q' to quit.")
+    
+    finally:
+        # One INSERT/commit for the whole session, also on quit or Ctrl+C
+        with transaction.atomic():
+            Rating.objects.bulk_create(pending, batch_size=500)
+            # bulk_create skips the signal that keeps movie rating stats current
+            Movie.refresh_rating_stats({rating.movie_id for rating in pending})
     
     # Session summary
-    print("\n" + "=" * 50)
+    print("\n" + _HR50)
     print("📊 Session Summary")
-    print("=" * 50)
+    print(_HR50)
     
     if ratings_given:
         total = sum(r[1] for r in ratings_given)
@@ -162,7 +171,7 @@ def main():
     Demonstrates: User input, Django ORM, if/else
     """
     print("\n🎬 CineSense Rating Session")
-    print("=" * 40)
+    print(_HR40)
     
     # Get or create user
     username = get_input("Enter username", str, "session_user")
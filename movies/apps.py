@@ -1,7 +1,31 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run settings.SQLITE_PRAGMAS on each new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma in getattr(settings, 'SQLITE_PRAGMAS', []):
+            cursor.execute(pragma)
 
 
 class MoviesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'movies'
     verbose_name = 'CineSense Movies'
+
+    def ready(self):
+        from movies import fts, signals
+        from movies.models import Movie, Rating
+
+        connection_created.connect(apply_sqlite_pragmas)
+        post_save.connect(signals.sync_movie_genres, sender=Movie)
+        post_save.connect(signals.update_movie_rating_stats, sender=Rating)
+        post_delete.connect(signals.update_movie_rating_stats, sender=Rating)
+        post_migrate.connect(signals.restore_fts_triggers, sender=self)
+        checks.register(fts.check_triggers, checks.Tags.database)
@@ -11,12 +11,58 @@ Demonstrates:
 - Collections (list) for choices
 """
 
+import re
 from django import forms
 from django.core.validators import MinValueValidator, MaxValueValidator
 from .models import Rating, Movie, UserProfile
 from typing import List
 
 
+# Runs of whitespace collapsed by MovieSearchForm.clean_query
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Choices are built once at import and shared by every form class
+STAR_CHOICES = (
+    (0.5, '½ Star'),
+    (1.0, '1 Star'),
+    (1.5, '1½ Stars'),
+    (2.0, '2 Stars'),
+    (2.5, '2½ Stars'),
+    (3.0, '3 Stars'),
+    (3.5, '3½ Stars'),
+    (4.0, '4 Stars'),
+    (4.5, '4½ Stars'),
+    (5.0, '5 Stars'),
+)
+
+GENRE_CHOICES = (
+    ('action', 'Action'),
+    ('comedy', 'Comedy'),
+    ('drama', 'Drama'),
+    ('horror', 'Horror'),
+    ('sci-fi', 'Sci-Fi'),
+    ('romance', 'Romance'),
+    ('thriller', 'Thriller'),
+    ('documentary', 'Documentary'),
+    ('animation', 'Animation'),
+    ('fantasy', 'Fantasy'),
+)
+
+# Genre value -> display label ('sci-fi' -> 'Sci-Fi')
+GENRE_LABELS = dict(GENRE_CHOICES)
+
+SORT_CHOICES = (
+    ('popularity', 'Most Popular'),
+    ('-popularity', 'Least Popular'),
+    ('title', 'Title A-Z'),
+    ('-title', 'Title Z-A'),
+    ('year', 'Oldest First'),
+    ('-year', 'Newest First'),
+    ('avg_rating', 'Highest Rated'),
+)
+
+
 class RatingForm(forms.ModelForm):
     """
     Form for submitting movie ratings.
@@ -26,18 +72,7 @@ class RatingForm(forms.ModelForm):
     """
     
     # Custom field with choices
-    STAR_CHOICES = [
-        (0.5, '½ Star'),
-        (1.0, '1 Star'),
-        (1.5, '1½ Stars'),
-        (2.0, '2 Stars'),
-        (2.5, '2½ Stars'),
-        (3.0, '3 Stars'),
-        (3.5, '3½ Stars'),
-        (4.0, '4 Stars'),
-        (4.5, '4½ Stars'),
-        (5.0, '5 Stars'),
-    ]
+    STAR_CHOICES = STAR_CHOICES
     
     stars = forms.ChoiceField(
         choices=STAR_CHOICES,
@@ -103,21 +138,14 @@ class RatingForm(forms.ModelForm):
         # String operations: split by comma
         tag_list = tags.split(',')
         
-        # List comprehension with string methods
-        # Strip whitespace, convert to lowercase, filter empty
-        cleaned_tags = [
-            tag.strip().lower()
-            for tag in tag_list
-            if tag.strip()  # Filter out empty tags
-        ]
-        
-        # Remove duplicates while preserving order (using dict trick)
-        seen = {}
-        unique_tags = []
-        for tag in cleaned_tags:
-            if tag not in seen:
-                seen[tag] = True
-                unique_tags.append(tag)
+        # Generator with string methods: strip whitespace, convert to
+        # lowercase, filter empty; dict.fromkeys drops duplicates while
+        # preserving order, all in a single pass
+        unique_tags = dict.fromkeys(
+            tag
+            for tag in (t.strip().lower() for t in tag_list)
+            if tag  # Filter out empty tags
+        )
         
         # Join back to comma-separated string
         return ', '.join(unique_tags)
@@ -150,35 +178,10 @@ class MovieSearchForm(forms.Form):
                  clean methods, collections (list of choices)
     """
     
-    # Genre choices as a list of tuples
-    GENRE_CHOICES = [
-        ('', 'All Genres'),
-        ('action', 'Action'),
-        ('comedy', 'Comedy'),
-        ('drama', 'Drama'),
-        ('horror', 'Horror'),
-        ('sci-fi', 'Sci-Fi'),
-        ('romance', 'Romance'),
-        ('thriller', 'Thriller'),
-        ('documentary', 'Documentary'),
-        ('animation', 'Animation'),
-        ('fantasy', 'Fantasy'),
-    ]
-    
-    SORT_CHOICES = [
-        ('popularity', 'Most Popular'),
-        ('-popularity', 'Least Popular'),
-        ('title', 'Title A-Z'),
-        ('-title', 'Title Z-A'),
-        ('year', 'Oldest First'),
-        ('-year', 'Newest First'),
-        ('avg_rating', 'Highest Rated'),
-    ]
-    
-    YEAR_CHOICES = [(None, 'Any Year')] + [
-        (year, str(year))
-        for year in range(2025, 1899, -1)  # Range: 2025 down to 1900
-    ]
+    # Genre choices as a tuple of tuples, with an "all" option up front
+    GENRE_CHOICES = (('', 'All Genres'),) + GENRE_CHOICES
+    
+    SORT_CHOICES = SORT_CHOICES
     
     query = forms.CharField(
         required=False,
@@ -243,12 +246,12 @@ class MovieSearchForm(forms.Form):
         year_from = cleaned_data.get('year_from')
         year_to = cleaned_data.get('year_to')
         
-        # Cross-field validation with if/else
-        if year_from and year_to:
-            if year_from > year_to:
-                raise forms.ValidationError(
-                    "From year cannot be greater than To year"
-                )
+        # Cross-field validation: compare only when both years were given
+        # (explicit None checks, so 0 is not mistaken for "unset")
+        if year_from is not None and year_to is not None and year_from > year_to:
+            raise forms.ValidationError(
+                "From year cannot be greater than To year"
+            )
         
         return cleaned_data
     
@@ -259,8 +262,8 @@ class MovieSearchForm(forms.Form):
         Demonstrates: String modification
         """
         query = self.cleaned_data.get('query', '')
-        # Strip and normalize whitespace
-        return ' '.join(query.split())
+        # Strip and normalize whitespace (precompiled regex, single pass)
+        return _WHITESPACE_RE.sub(' ', query).strip()
 
 
 class MovieForm(forms.ModelForm):
@@ -316,17 +319,16 @@ class MovieForm(forms.ModelForm):
         if not genres:
             return ''
         
-        # Split and clean genres
-        genre_list = []
-        for genre in genres.split(','):
-            cleaned = genre.strip().title()  # String methods
-            if cleaned and len(cleaned) <= 50:  # Validate length
-                genre_list.append(cleaned)
-        
-        # Remove duplicates using set, then sort
-        unique_genres = sorted(set(genre_list))
+        # Split, clean and dedupe in one pass with a set comprehension
+        # (string methods, length validation) on the lowercased names
+        unique_genres = {
+            genre
+            for genre in (g.strip().lower() for g in genres.split(','))
+            if 0 < len(genre) <= 50  # Validate length
+        }
         
-        return ', '.join(unique_genres)
+        # Title-case only the survivors, then sort
+        return ', '.join(sorted(genre.title() for genre in unique_genres))
     
     def save(self, commit=True):
         """
@@ -353,18 +355,7 @@ class UserProfileForm(forms.ModelForm):
     Demonstrates: ModelForm, multi-select, form processing
     """
     
-    GENRE_CHOICES = [
-        ('action', 'Action'),
-        ('comedy', 'Comedy'),
-        ('drama', 'Drama'),
-        ('horror', 'Horror'),
-        ('sci-fi', 'Sci-Fi'),
-        ('romance', 'Romance'),
-        ('thriller', 'Thriller'),
-        ('documentary', 'Documentary'),
-        ('animation', 'Animation'),
-        ('fantasy', 'Fantasy'),
-    ]
+    GENRE_CHOICES = GENRE_CHOICES
     
     favorite_genres_select = forms.MultipleChoiceField(
         required=False,
@@ -390,10 +381,10 @@ class UserProfileForm(forms.ModelForm):
         # Pre-select existing favorite genres
         if self.instance and self.instance.pk:
             current_genres = self.instance.get_favorite_genres_list()
-            # Convert to lowercase for matching
-            self.initial['favorite_genres_select'] = [
-                g.lower() for g in current_genres
-            ]
+            # Casefold for matching against the lowercase choice values
+            self.initial['favorite_genres_select'] = list(
+                map(str.casefold, current_genres)
+            )
     
     def save(self, commit=True):
         """
@@ -406,8 +397,8 @@ class UserProfileForm(forms.ModelForm):
         # Get selected genres (list of lowercase strings)
         selected = self.cleaned_data.get('favorite_genres_select', [])
         
-        # Convert to title case and join
-        genres_str = ', '.join([g.title() for g in selected])
+        # Look up each display label and join
+        genres_str = ', '.join([GENRE_LABELS[g] for g in selected])
         instance.favorite_genres = genres_str
         
         if commit:
@@ -446,8 +437,19 @@ class QuickRatingForm(forms.Form):
         # Casting to int (may be string from form)
         movie_id = int(movie_id)
         
-        # Check if movie exists
-        if not Movie.objects.filter(pk=movie_id).exists():
+        # Fetch just the pk; a caller can link a Rating to form.movie
+        # without querying again
+        self._movie = Movie.objects.only('id').filter(pk=movie_id).first()
+        if self._movie is None:
             raise forms.ValidationError("Movie not found")
         
         return movie_id
+    
+    @property
+    def movie(self):
+        """
+        The Movie validated by clean_movie_id (None before validation).
+        
+        Only its pk is loaded; other fields are deferred.
+        """
+        return getattr(self, '_movie', None)
@@ -0,0 +1,90 @@
+"""
+SQLite full-text index on movie titles (created by migration 0004).
+
+movie_fts is an external-content FTS5 table kept in step with movies_movie
+by three raw triggers. Django does not know about those triggers, so any
+migration that remakes movies_movie on SQLite (AddField with a default,
+AlterField, ...) silently drops them and the index goes stale.
+
+Two guards cover that:
+- restore_triggers() runs after every migrate (MoviesConfig.ready connects
+  it to post_migrate), recreating missing triggers and rebuilding the index.
+- check_triggers() is a database system check, reported by
+  `python manage.py check --database default` and before migrate.
+
+To rebuild the index by hand (e.g. after restoring a table dump):
+
+    INSERT INTO movie_fts(movie_fts) VALUES ('rebuild');
+"""
+
+from typing import List
+
+from django.core import checks
+
+
+FTS_TABLE = 'movie_fts'
+
+TRIGGERS = {
+    'movie_fts_ai': (
+        "CREATE TRIGGER movie_fts_ai AFTER INSERT ON movies_movie BEGIN "
+        "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END"
+    ),
+    'movie_fts_ad': (
+        "CREATE TRIGGER movie_fts_ad AFTER DELETE ON movies_movie BEGIN "
+        "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); END"
+    ),
+    'movie_fts_au': (
+        "CREATE TRIGGER movie_fts_au AFTER UPDATE OF title ON movies_movie BEGIN "
+        "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+        "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END"
+    ),
+}
+
+REBUILD_SQL = "INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')"
+
+
+def missing_triggers(connection) -> List[str]:
+    """
+    Names of the FTS triggers absent from the database.
+
+    Empty when the backend is not SQLite or movie_fts was never created
+    (no FTS5 support), since there is nothing to keep in sync then.
+    """
+    if connection.vendor != 'sqlite':
+        return []
+    if FTS_TABLE not in connection.introspection.table_names():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        existing = {row[0] for row in cursor.fetchall()}
+    return [name for name in TRIGGERS if name not in existing]
+
+
+def restore_triggers(connection) -> List[str]:
+    """
+    Recreate missing FTS triggers and rebuild the index if any were missing
+    (rows written meanwhile were never indexed). Returns the names restored.
+    """
+    missing = missing_triggers(connection)
+    if missing:
+        with connection.cursor() as cursor:
+            for name in missing:
+                cursor.execute(TRIGGERS[name])
+            cursor.execute(REBUILD_SQL)
+    return missing
+
+
+def check_triggers(app_configs=None, databases=None, **kwargs):
+    """System check: warn when the FTS index has lost its triggers."""
+    from django.db import connections
+
+    errors = []
+    for alias in databases or []:
+        missing = missing_triggers(connections[alias])
+        if missing:
+            errors.append(checks.Warning(
+                f"movie_fts triggers missing on '{alias}': {', '.join(missing)}",
+                hint="Run `python manage.py migrate` to restore them and rebuild the index.",
+                id='movies.W001',
+            ))
+    return errors
@@ -7,11 +7,29 @@ Usage:
     python manage.py cleanup_dups --by-title   # Dedupe by title+year instead of tmdb_id
 """
 
+from itertools import groupby
+from operator import itemgetter
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.db.models import Count, Min
 from movies.models import Movie
 
 
+# Ordering that puts the row to keep first within each duplicate group
+KEEP_ORDER = {
+    'first': ('id',),
+    'last': ('-id',),
+    'highest-rated': ('-imdb_rating', '-id'),
+    'most-popular': ('-popularity', '-id'),
+}
+
+# Number of ids per DELETE ... WHERE id IN (...) query
+DELETE_BATCH_SIZE = 500
+
+# Number of duplicate keys per SELECT ... WHERE key IN (...) query
+KEY_BATCH_SIZE = 500
+
+
 class Command(BaseCommand):
     help = 'Find and remove duplicate movies from the database'
 
@@ -57,7 +75,9 @@ class Command(BaseCommand):
             .order_by('-count')
         )
         
-        total_dups = duplicates.count()
+        # Run the aggregation once and reuse the result
+        dup_list = list(duplicates)
+        total_dups = len(dup_list)
         
         if total_dups == 0:
             self.stdout.write(self.style.SUCCESS("✅ No duplicate tmdb_id entries found!"))
@@ -65,39 +85,23 @@ class Command(BaseCommand):
         
         self.stdout.write(f"Found {total_dups} tmdb_ids with duplicates\n")
         
-        deleted_count = 0
+        keys = sorted(dup['tmdb_id'] for dup in dup_list)
+        delete_ids = []
         
-        for dup in duplicates:
-            tmdb_id = dup['tmdb_id']
-            count = dup['count']
-            
-            # Get all movies with this tmdb_id
-            movies = Movie.objects.filter(tmdb_id=tmdb_id)
-            
-            # Determine which one to keep based on strategy
-            if keep_strategy == 'first':
-                keep = movies.order_by('id').first()
-            elif keep_strategy == 'last':
-                keep = movies.order_by('-id').first()
-            elif keep_strategy == 'highest-rated':
-                keep = movies.order_by('-imdb_rating', '-id').first()
-            elif keep_strategy == 'most-popular':
-                keep = movies.order_by('-popularity', '-id').first()
-            else:
-                keep = movies.first()
-            
-            to_delete = movies.exclude(id=keep.id)
+        for tmdb_id, group in self._duplicate_groups(('tmdb_id',), keys, keep_strategy, 'title'):
+            keep, *extra = group
+            keep_id, _, keep_title = keep
+            delete_ids.extend(row[0] for row in extra)
             
             self.stdout.write(
-                f"  tmdb_id {tmdb_id}: {count} copies, "
-                f"keeping '{keep.title}' (id={keep.id})"
+                f"  tmdb_id {tmdb_id}: {len(extra) + 1} copies, "
+                f"keeping '{keep_title}' (id={keep_id})"
             )
-            
-            if execute:
-                deleted, _ = to_delete.delete()
-                deleted_count += deleted
-            else:
-                deleted_count += to_delete.count()
+        
+        if execute:
+            deleted_count = self._delete_movies(delete_ids)
+        else:
+            deleted_count = len(delete_ids)
         
         self.stdout.write("")
         
@@ -124,7 +128,9 @@ class Command(BaseCommand):
             .order_by('-count')
         )
         
-        total_dups = duplicates.count()
+        # Run the aggregation once and reuse the result
+        dup_list = list(duplicates)
+        total_dups = len(dup_list)
         
         if total_dups == 0:
             self.stdout.write(self.style.SUCCESS("✅ No duplicate title+year entries found!"))
@@ -132,42 +138,36 @@ class Command(BaseCommand):
         
         self.stdout.write(f"Found {total_dups} title+year combinations with duplicates\n")
         
-        deleted_count = 0
+        dup_keys = {(dup['title'], dup['year']) for dup in dup_list}
+        keys = sorted({title for title, _ in dup_keys})
+        # Show the 50 most duplicated groups, sliced from the same result
+        shown = dup_list[:50]
+        kept = {(dup['title'], dup['year']): None for dup in shown}
+        delete_ids = []
         
-        for dup in duplicates[:50]:  # Show first 50
-            title = dup['title']
-            year = dup['year']
-            count = dup['count']
+        for (title, year), group in self._duplicate_groups(('title', 'year'), keys, keep_strategy):
+            if (title, year) not in dup_keys:
+                continue  # Same title, different year
             
-            # Get all movies with this title+year
-            movies = Movie.objects.filter(title=title, year=year)
-            
-            # Determine which one to keep based on strategy
-            if keep_strategy == 'first':
-                keep = movies.order_by('id').first()
-            elif keep_strategy == 'last':
-                keep = movies.order_by('-id').first()
-            elif keep_strategy == 'highest-rated':
-                keep = movies.order_by('-imdb_rating', '-id').first()
-            elif keep_strategy == 'most-popular':
-                keep = movies.order_by('-popularity', '-id').first()
-            else:
-                keep = movies.first()
-            
-            to_delete = movies.exclude(id=keep.id)
+            keep, *extra = group
+            delete_ids.extend(row[0] for row in extra)
             
+            if (title, year) in kept:
+                kept[title, year] = keep[0]
+        
+        for dup in shown:
             self.stdout.write(
-                f"  '{title}' ({year}): {count} copies, keeping id={keep.id}"
+                f"  '{dup['title']}' ({dup['year']}): {dup['count']} copies, "
+                f"keeping id={kept[dup['title'], dup['year']]}"
             )
-            
-            if execute:
-                deleted, _ = to_delete.delete()
-                deleted_count += deleted
-            else:
-                deleted_count += to_delete.count()
         
-        if total_dups > 50:
-            self.stdout.write(f"  ... and {total_dups - 50} more")
+        if execute:
+            deleted_count = self._delete_movies(delete_ids)
+        else:
+            deleted_count = len(delete_ids)
+        
+        if total_dups > len(shown):
+            self.stdout.write(f"  ... and {total_dups - len(shown)} more")
         
         self.stdout.write("")
         
@@ -180,3 +180,39 @@ class Command(BaseCommand):
             ))
         
         self.stdout.write(f"\nTotal movies in database: {Movie.objects.count()}")
+    
+    def _duplicate_groups(self, key_fields: tuple, keys: list, keep_strategy: str, *fields):
+        """
+        Yield (key, rows) for each group of movies sharing key_fields.
+        
+        Rows are (id, *key_fields, *fields) tuples fetched with indexed IN
+        lookups on the first key field, a batch of keys at a time, and each
+        group lists the row to keep first.
+        """
+        lookup = f'{key_fields[0]}__in'
+        key = itemgetter(*range(1, len(key_fields) + 1))
+        for start in range(0, len(keys), KEY_BATCH_SIZE):
+            rows = (
+                Movie.objects
+                .filter(**{lookup: keys[start:start + KEY_BATCH_SIZE]})
+                .order_by(*key_fields, *KEEP_ORDER[keep_strategy])
+                .values_list('id', *key_fields, *fields)
+            )
+            yield from groupby(rows, key=key)
+    
+    def _delete_movies(self, ids: list) -> int:
+        """
+        Delete movies by id in batches; returns the number of movies deleted.
+        
+        All batches run in one transaction: a single commit, and nothing is
+        deleted if any batch fails.
+        """
+        deleted_count = 0
+        # only('id'): the delete collector would otherwise load every column
+        # (overview included) of each doomed row before deleting it
+        movies = Movie.objects.only('id')
+        with transaction.atomic():
+            for start in range(0, len(ids), DELETE_BATCH_SIZE):
+                _, per_model = movies.filter(id__in=ids[start:start + DELETE_BATCH_SIZE]).delete()
+                deleted_count += per_model.get(Movie._meta.label, 0)
+        return deleted_count
@@ -1,15 +1,87 @@
 """
 Management command to fetch movie posters from OMDB API.
 Updates existing movies with poster URLs from IMDB.
+
+Requests run concurrently in a thread pool (the work is network-bound),
+while a shared rate limiter keeps the overall request rate at
+1 / --delay requests per second.
+
+Lookups are remembered in a small SQLite file (settings.OMDB_POSTER_CACHE),
+so re-runs skip titles already seen. Misses are retried after 7 days;
+failed requests (network errors, quota) are not cached at all.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from movies.models import Movie
-from movies.services.external_apis import OMDBApiClient
+from movies.services.external_apis import OMDBApiClient, RateLimiter
+import sqlite3
+import threading
 import time
 
 
+# Number of updated movies written per bulk_update
+UPDATE_BATCH_SIZE = 500
+
+# Movies read per query while queueing lookups
+READ_BATCH_SIZE = 500
+
+# Lookups kept in flight per worker; bounds memory to a window of movies
+IN_FLIGHT_PER_WORKER = 4
+
+
+class PosterCache:
+    """
+    Persistent (title, year) -> poster URL cache shared by worker threads.
+
+    Found posters are kept indefinitely; misses are stored as '' and
+    expire after NEGATIVE_TTL seconds so they are eventually retried.
+    """
+
+    NEGATIVE_TTL = 7 * 24 * 3600  # 7 days
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS poster_cache ('
+            'title TEXT NOT NULL, year INTEGER NOT NULL, poster TEXT NOT NULL, '
+            'fetched_at REAL NOT NULL, PRIMARY KEY (title, year))'
+        )
+
+    def get(self, title: str, year):
+        """Return the cached poster ('' for a recent miss), or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT poster, fetched_at FROM poster_cache WHERE title = ? AND year = ?',
+                (title, year or 0),
+            ).fetchone()
+        if row is None:
+            return None
+        poster, fetched_at = row
+        if not poster and time.time() - fetched_at > self.NEGATIVE_TTL:
+            return None  # Expired miss: look it up again
+        return poster
+
+    def set(self, title: str, year, poster):
+        """Remember a lookup result (None/'' records a miss)."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO poster_cache VALUES (?, ?, ?, ?)',
+                (title, year or 0, poster or '', time.time()),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class Command(BaseCommand):
     help = 'Fetch movie posters from OMDB API for all movies without posters'
 
@@ -25,58 +97,139 @@ class Command(BaseCommand):
             default=0.5,
             help='Delay between API requests in seconds (default: 0.5)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=10,
+            help='Number of concurrent API requests (default: 10)',
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Ignore cached lookups and query OMDB again',
+        )
 
     def handle(self, *args, **options):
-        client = OMDBApiClient()
-        
+        limiter = RateLimiter(options['delay'])
+        client = OMDBApiClient(throttle=limiter.wait)
+
         if not client.api_key:
             self.stdout.write(self.style.ERROR('OMDB API key not configured. Add OMDB_API_KEY to your .env file.'))
             return
-        
-        # Get movies to update
+
+        # Get movies to update (one WHERE clause, only the columns we use)
         if options['all']:
             movies = Movie.objects.all()
         else:
-            movies = Movie.objects.filter(poster_path='') | Movie.objects.filter(poster_path__isnull=True)
-        
+            movies = Movie.objects.filter(Q(poster_path='') | Q(poster_path__isnull=True))
+        movies = movies.only('id', 'title', 'year', 'poster_path')
+
         total = movies.count()
         updated = 0
         failed = 0
-        
+        pending = []  # Movies with a new poster_path, not yet saved
+        poster_cache = PosterCache(settings.OMDB_POSTER_CACHE)
+        use_cache = not options['refresh']
+
         self.stdout.write(f'Fetching posters for {total} movies...\n')
-        
-        for i, movie in enumerate(movies, 1):
-            self.stdout.write(f'[{i}/{total}] Fetching poster for: {movie.title} ({movie.year})... ', ending='')
-            
-            try:
-                # Search OMDB by title and year
-                movie_data = client.search_by_title(movie.title, movie.year)
-                
-                if movie_data and movie_data.poster and movie_data.poster != 'N/A':
-                    movie.poster_path = movie_data.poster
-                    movie.save(update_fields=['poster_path'])
-                    updated += 1
-                    self.stdout.write(self.style.SUCCESS('✓'))
-                else:
-                    # Try without year
-                    movie_data = client.search_by_title(movie.title)
-                    if movie_data and movie_data.poster and movie_data.poster != 'N/A':
-                        movie.poster_path = movie_data.poster
-                        movie.save(update_fields=['poster_path'])
+
+        workers = max(1, options['workers'])
+        max_in_flight = workers * IN_FLIGHT_PER_WORKER
+        to_fetch = self._iter_movies(movies)
+        in_flight = {}  # future -> movie
+        i = 0
+
+        # Worker threads only talk to OMDB; all database writes stay on this thread
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # Top the window up, then handle whatever finishes first
+                for movie in islice(to_fetch, max_in_flight - len(in_flight)):
+                    future = executor.submit(self._fetch_poster, client, poster_cache, use_cache, movie)
+                    in_flight[future] = movie
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    movie = in_flight.pop(future)
+                    i += 1
+                    self.stdout.write(f'[{i}/{total}] Fetching poster for: {movie.title} ({movie.year})... ', ending='')
+
+                    try:
+                        poster = future.result()
+                    except Exception as e:
+                        failed += 1
+                        self.stdout.write(self.style.ERROR(f'error: {e}'))
+                        continue
+
+                    if poster:
+                        movie.poster_path = poster
+                        pending.append(movie)
                         updated += 1
                         self.stdout.write(self.style.SUCCESS('✓'))
                     else:
                         failed += 1
                         self.stdout.write(self.style.WARNING('not found'))
-                        
-            except Exception as e:
-                failed += 1
-                self.stdout.write(self.style.ERROR(f'error: {e}'))
-            
-            # Rate limiting
-            time.sleep(options['delay'])
-        
+
+                    if len(pending) >= UPDATE_BATCH_SIZE:
+                        self._flush(pending)
+
+        self._flush(pending)
+        poster_cache.close()
+
         self.stdout.write('')
         self.stdout.write(self.style.SUCCESS(f'Done! Updated {updated} movies with posters.'))
         if failed:
             self.stdout.write(self.style.WARNING(f'{failed} movies could not be updated.'))
+
+    @staticmethod
+    def _iter_movies(movies):
+        """
+        Yield movies a page at a time, keyset-paginated by pk.
+
+        Each page is a separate short query, so no cursor stays open while
+        _flush writes to the same table (SQLite gives no isolation there).
+        """
+        movies = movies.order_by('pk')
+        last_pk = 0
+        while True:
+            page = list(movies.filter(pk__gt=last_pk)[:READ_BATCH_SIZE])
+            if not page:
+                return
+            yield from page
+            last_pk = page[-1].pk
+
+    @staticmethod
+    def _flush(pending: list):
+        """Write buffered poster paths in one transaction and clear the buffer."""
+        if not pending:
+            return
+        with transaction.atomic():
+            Movie.objects.bulk_update(pending, ['poster_path'], batch_size=UPDATE_BATCH_SIZE)
+        pending.clear()
+
+    @staticmethod
+    def _fetch_poster(client: OMDBApiClient, poster_cache: PosterCache, use_cache: bool, movie: Movie):
+        """
+        Look up a poster URL for one movie (runs in a worker thread).
+
+        Returns the poster URL, or None if OMDB has no poster. Failed
+        requests raise OMDBRequestError and are not cached, so the next run
+        retries them.
+        """
+        if use_cache:
+            cached = poster_cache.get(movie.title, movie.year)
+            if cached is not None:
+                return cached or None
+
+        # Search OMDB by title and year, falling back to title alone
+        # (the client's throttle applies the rate limit to every request)
+        movie_data = client.search_by_title(
+            movie.title, movie.year, year_fallback=True, raise_errors=True
+        )
+
+        poster = None
+        if movie_data and movie_data.poster and movie_data.poster != 'N/A':
+            poster = movie_data.poster
+        poster_cache.set(movie.title, movie.year, poster)
+        return poster
@@ -27,7 +27,15 @@ Dataset Download:
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.db import transaction, connection
-from movies.models import Movie
+from django.db.models import Max
+from django.utils import timezone
+from movies.models import Genre, Movie
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter, itemgetter
+import io
+import queue
+import threading
 import time
 import os
 import sys
@@ -37,6 +45,161 @@ import sys
 # TMDB BULK IMPORT FUNCTIONS
 # =============================================================================
 
+# Movie columns of an imported row, in the order of the row tuples built for
+# COPY (COPY_DEFAULT_FIELDS and created_at/updated_at are appended per batch)
+IMPORT_FIELDS = (
+    'title', 'year', 'genres', 'overview', 'poster_path', 'runtime', 'imdb_id',
+    'tmdb_id', 'imdb_rating', 'imdb_votes', 'metascore', 'rotten_tomatoes',
+    'director', 'writer', 'actors', 'rated', 'released', 'language', 'country',
+    'awards', 'box_office', 'production', 'popularity',
+)
+
+# NOT NULL columns with a model default but no database default (Django
+# drops it after AddField), so COPY must supply their values explicitly
+COPY_DEFAULT_FIELDS = ('avg_rating_cached', 'rating_count_cached')
+
+# Existing TMDB ids fetched per round trip when preloading
+PRELOAD_CHUNK_SIZE = 100_000
+
+# Movies inserted per transaction (see BatchWriter)
+DEFAULT_COMMIT_EVERY = 50_000
+
+# Upper bound on movies per batch: keeps a single COPY buffer or INSERT
+# statement for these wide rows well below PostgreSQL's 1 GB allocation limit
+MAX_BATCH = 5000
+
+
+class TmdbIdSet:
+    """
+    Exact set of TMDB ids stored as a bitmap (one bit per possible id).
+    
+    TMDB ids are dense positive integers, so a bytearray indexed by id uses
+    ~1 bit per id instead of the ~60 bytes a Python set spends per int.
+    Unlike a Bloom filter there are no false positives, so no new movie is
+    ever skipped. Ids outside the bitmap range fall back to a small set.
+    """
+    
+    MAX_BITMAP_ID = 1 << 28  # 32 MB of bitmap at most
+    
+    def __init__(self, capacity: int = 0):
+        # Ids past MAX_BITMAP_ID go to _overflow, so never allocate beyond it
+        capacity = min(max(capacity, 0), self.MAX_BITMAP_ID - 1)
+        self._bits = bytearray((capacity >> 3) + 1)
+        self._overflow = set()
+    
+    def add(self, tmdb_id: int) -> None:
+        if not 0 <= tmdb_id < self.MAX_BITMAP_ID:
+            self._overflow.add(tmdb_id)
+            return
+        byte = tmdb_id >> 3
+        if byte >= len(self._bits):
+            # Grow geometrically so repeated adds stay amortized O(1)
+            size = min(max(byte + 1, 2 * len(self._bits)), self.MAX_BITMAP_ID >> 3)
+            self._bits.extend(bytes(size - len(self._bits)))
+        self._bits[byte] |= 1 << (tmdb_id & 7)
+    
+    def update(self, tmdb_ids) -> None:
+        add = self.add
+        for tmdb_id in tmdb_ids:
+            add(tmdb_id)
+    
+    def __contains__(self, tmdb_id: int) -> bool:
+        if not 0 <= tmdb_id < self.MAX_BITMAP_ID:
+            return tmdb_id in self._overflow
+        byte = tmdb_id >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (tmdb_id & 7)))
+
+
+class BatchWriter:
+    """
+    Inserts batches on background threads while the caller keeps parsing.
+    
+    Batches pass through a bounded queue, so parsing runs at most `depth`
+    batches ahead of the database. Each writer thread uses its own database
+    connection; SQLite allows only one writer at a time, so it gets one.
+    
+    Each thread writes inside one long transaction, committed every
+    `commit_every` movies and at the end, rather than once per batch.
+    """
+    
+    def __init__(self, command, workers: int = None, depth: int = 4,
+                 commit_every: int = DEFAULT_COMMIT_EVERY):
+        if connection.vendor == 'sqlite':
+            workers = 1
+        elif workers is None:
+            workers = min(4, os.cpu_count() or 1)
+        
+        self.command = command
+        self.commit_every = max(1, commit_every)
+        self.imported = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=depth)
+        self._error = None
+        self._threads = [
+            threading.Thread(target=self._run, name=f'import-writer-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def put(self, batch: list) -> None:
+        """Queue a batch for insertion (blocks while the queue is full)."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(batch)
+    
+    def close(self) -> int:
+        """Wait for queued batches to be written; returns the number inserted."""
+        for _ in self._threads:
+            self._queue.put(None)  # One stop sentinel per thread
+        for thread in self._threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.imported
+    
+    def _run(self):
+        uncommitted = 0  # Movies written since this thread's last commit
+        transaction.set_autocommit(False)
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    break
+                if self._error is not None:
+                    continue  # Keep draining so put() never blocks forever
+                try:
+                    inserted = _bulk_create_batch(batch, self.command)
+                    uncommitted += len(batch)
+                    if uncommitted >= self.commit_every:
+                        transaction.commit()
+                        uncommitted = 0
+                except Exception as e:
+                    self._error = e
+                    continue
+                with self._lock:
+                    self.imported += inserted
+            transaction.commit()
+        finally:
+            if connection.connection is not None and not connection.get_autocommit():
+                transaction.rollback()  # Only reached uncommitted after an error
+                transaction.set_autocommit(True)
+            connection.close()  # This thread's connection
+
+
+def _new_id_set(capacity: int = 0):
+    """
+    Empty set of TMDB ids for deduplication: a pyroaring BitMap when that
+    package is installed (compressed, fast for sparse ranges), otherwise a
+    TmdbIdSet. Both are exact and share the add/update/in API.
+    """
+    try:
+        from pyroaring import BitMap
+    except ImportError:
+        return TmdbIdSet(capacity=capacity)
+    return BitMap()
+
+
 def bulk_import_tmdb(
     command,
     file_path: str,
@@ -46,6 +209,9 @@ def bulk_import_tmdb(
     min_popularity: float = 0.0,
     min_votes: int = 0,
     only_released: bool = True,
+    preload_existing: bool = True,
+    drop_indexes: bool = False,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
 ):
     """
     Bulk import movies from TMDB dataset file (CSV or JSON).
@@ -63,6 +229,13 @@ def bulk_import_tmdb(
         min_popularity: Minimum popularity threshold
         min_votes: Minimum vote count (CSV only, filters obscure movies)
         only_released: Only import released movies (CSV only)
+        preload_existing: Load existing TMDB ids up front to skip known
+            movies in Python; when False the database's conflict handling
+            skips them and only duplicates within a batch are caught here
+        drop_indexes: Drop secondary indexes for the load and rebuild them
+            afterwards (unique and primary key indexes are kept)
+        commit_every: Commit after this many inserted movies (larger means
+            fewer commits; an interrupted run keeps what was committed)
     
     Returns:
         Tuple of (imported_count, skipped_count, total_processed)
@@ -81,6 +254,12 @@ def bulk_import_tmdb(
             "Install tqdm for progress bar: pip install tqdm"
         ))
     
+    if batch_size > MAX_BATCH:
+        command.stdout.write(command.style.WARNING(
+            f"Batch size {batch_size:,} capped at {MAX_BATCH:,}"
+        ))
+        batch_size = MAX_BATCH
+    
     # Detect file format
     file_format = detect_file_format(file_path)
     is_csv = file_format == 'csv'
@@ -91,13 +270,29 @@ def bulk_import_tmdb(
     else:
         command.stdout.write("   📦 Using TMDB JSON parser")
     
-    # Get existing TMDB IDs for deduplication
-    command.stdout.write("\nLoading existing movie IDs for deduplication...")
-    existing_ids = set(
-        Movie.objects.filter(tmdb_id__isnull=False)
-        .values_list('tmdb_id', flat=True)
-    )
-    command.stdout.write(f"Found {len(existing_ids):,} existing movies with TMDB IDs")
+    if preload_existing:
+        # Get existing TMDB IDs for deduplication (compact bitmap, streamed in)
+        command.stdout.write("\nLoading existing movie IDs for deduplication...")
+        id_rows = Movie.objects.filter(tmdb_id__isnull=False)
+        existing_count = id_rows.count()
+        existing_ids = _new_id_set(id_rows.aggregate(Max('tmdb_id'))['tmdb_id__max'] or 0)
+        # Inside a transaction PostgreSQL streams through a plain server-side
+        # cursor (no WITH HOLD copy of the result)
+        with transaction.atomic():
+            ids = id_rows.values_list('tmdb_id', flat=True).iterator(chunk_size=PRELOAD_CHUNK_SIZE)
+            loaded = 0
+            while chunk := list(islice(ids, PRELOAD_CHUNK_SIZE)):
+                existing_ids.update(chunk)
+                loaded += len(chunk)
+                if existing_count > PRELOAD_CHUNK_SIZE:
+                    command.stdout.write(f"\r   {loaded:,}/{existing_count:,} ids loaded", ending='')
+        command.stdout.write(f"\nFound {existing_count:,} existing movies with TMDB IDs")
+    else:
+        # No preload: ids seen in the current batch only (cleared on flush),
+        # the unique tmdb_id constraint skips everything else
+        command.stdout.write("\nSkipping ID preload; the database will skip existing movies")
+        existing_ids = set()
+        count_before = Movie.objects.count()
     
     # Stats tracking
     imported = 0
@@ -117,19 +312,22 @@ def bulk_import_tmdb(
         movie_iter = parser.stream_movies(only_released=only_released, min_votes=min_votes)
     else:
         parser = TMDBParser(file_path)
-        movie_iter = parser.stream_movies()
+        movie_iter = parser.stream_movies(skip_adult=skip_adult, min_popularity=min_popularity)
     
-    # Wrap with tqdm if available
+    # Progress bar (if tqdm is available), advanced once per batch rather
+    # than per row
+    progress = None
     if use_tqdm:
         # For gzipped files, we can't know total count easily
         # Use the limit as the expected total
-        movie_iter = tqdm(
-            movie_iter,
+        progress = tqdm(
             total=limit,
             desc="Importing",
             unit="movies",
             ncols=100,
+            mininterval=0.5,
         )
+    last_report = 0.0  # time.monotonic() of the last text progress line
     
     command.stdout.write(f"\n🎬 Starting bulk import from {file_path}...")
     command.stdout.write(f"   Limit: {limit:,} movies")
@@ -139,37 +337,38 @@ def bulk_import_tmdb(
         command.stdout.write(f"   Min votes: {min_votes}")
     command.stdout.write("")
     
+    # Every insert also updates each secondary index; with drop_indexes they
+    # are rebuilt once at the end instead
+    dropped_indexes = _drop_secondary_indexes(command) if drop_indexes else []
+    
+    # Parsing stays on this thread (it alone touches existing_ids);
+    # full batches are inserted by the writer thread(s) meanwhile
+    writer = BatchWriter(command, commit_every=commit_every)
+    queued = 0  # Movies handed to the writer so far
+    
+    # Bind hot-loop lookups to locals once (this loop can run a million times)
+    is_json = not is_csv
+    seen = existing_ids.__contains__
+    see = existing_ids.add
+    append = batch.append
+    # COPY (PostgreSQL) takes plain value tuples, skipping Movie.__init__
+    if connection.vendor == 'postgresql':
+        make_row = itemgetter(*IMPORT_FIELDS)
+    else:
+        make_row = _movie_from_fields
+    convert = TMDBParser.movie_to_django_fields
+    
     try:
         for movie_data in movie_iter:
             # Check limit
-            if imported >= limit:
+            if queued >= limit:
                 break
             
             processed += 1
             
-            # For JSON format, apply additional filters
-            if not is_csv:
-                # Skip adult movies if requested
-                if skip_adult and movie_data.get('adult', False):
-                    skipped_adult += 1
-                    continue
-                
-                # Check popularity threshold
-                popularity = movie_data.get('popularity', 0.0)
-                try:
-                    popularity = float(popularity)
-                except (ValueError, TypeError):
-                    popularity = 0.0
-                
-                if popularity < min_popularity:
-                    skipped_unpopular += 1
-                    continue
-                
-                # Convert to Django fields
-                fields = TMDBParser.movie_to_django_fields(movie_data)
-            else:
-                # CSV already returns Django-ready fields
-                fields = movie_data
+            # Both parsers apply their filters while streaming;
+            # CSV already returns Django-ready fields
+            fields = convert(movie_data) if is_json else movie_data
             
             if not fields:
                 skipped_invalid += 1
@@ -177,25 +376,31 @@ def bulk_import_tmdb(
             
             # Check for duplicates
             tmdb_id = fields['tmdb_id']
-            if tmdb_id in existing_ids:
+            if seen(tmdb_id):
                 skipped_existing += 1
                 continue
             
             # Add to existing IDs set to catch duplicates within file
-            existing_ids.add(tmdb_id)
+            see(tmdb_id)
             
-            # Create Movie instance (don't save yet)
-            movie = Movie(**fields)
-            batch.append(movie)
+            # Create the row (don't save yet)
+            append(make_row(fields))
             
-            # Bulk create when batch is full
+            # Hand the batch to the writer when full
             if len(batch) >= batch_size:
-                _bulk_create_batch(batch, command)
-                imported += len(batch)
-                batch = []
+                writer.put(batch[:])
+                queued += len(batch)
+                if progress is not None:
+                    progress.update(len(batch))
+                batch.clear()  # Keep the list bound to append
+                if not preload_existing:
+                    existing_ids.clear()
                 
-                # Progress update (if not using tqdm)
-                if not use_tqdm:
+                # Progress update (if not using tqdm), at most once a second
+                now = time.monotonic()
+                if progress is None and now - last_report >= 1.0:
+                    last_report = now
+                    imported = writer.imported
                     elapsed = time.time() - start_time
                     rate = imported / elapsed if elapsed > 0 else 0
                     eta = (limit - imported) / rate if rate > 0 else 0
@@ -208,69 +413,304 @@ def bulk_import_tmdb(
         
         # Final batch
         if batch:
-            _bulk_create_batch(batch, command)
-            imported += len(batch)
+            writer.put(batch[:])
+            if progress is not None:
+                progress.update(len(batch))
     
     except KeyboardInterrupt:
         command.stdout.write(command.style.WARNING("\n\n⚠️ Import interrupted by user"))
         # Save any remaining batch
         if batch:
-            _bulk_create_batch(batch, command)
-            imported += len(batch)
+            writer.put(batch[:])
+    
+    finally:
+        if progress is not None:
+            progress.close()
+        try:
+            imported = writer.close()
+        finally:
+            _recreate_indexes(dropped_indexes, command)
+    
+    if is_csv:
+        skipped_existing += parser.skipped_duplicates  # Repeats dropped by pandas
+    else:
+        skipped_adult = parser.skipped_adult
+        skipped_unpopular = parser.skipped_unpopular
+    
+    if not preload_existing:
+        # Rows the database skipped as existing are only visible in the count
+        inserted = Movie.objects.count() - count_before
+        skipped_existing += imported - inserted
+        imported = inserted
+    
+    # COPY / bulk_create skip signals: link the new movies' genres now
+    Genre.sync_unlinked()
     
     # Calculate final stats
     elapsed = time.time() - start_time
     rate = imported / elapsed if elapsed > 0 else 0
     
-    # Print summary
-    command.stdout.write("\n")
-    command.stdout.write(command.style.SUCCESS("=" * 60))
-    command.stdout.write(command.style.SUCCESS("✅ BULK IMPORT COMPLETE!"))
-    command.stdout.write(command.style.SUCCESS("=" * 60))
-    command.stdout.write(f"   📥 Imported:        {imported:,} new movies")
-    command.stdout.write(f"   ⏭️  Skipped (exist): {skipped_existing:,}")
-    command.stdout.write(f"   ⚠️  Skipped (invalid):{skipped_invalid:,}")
+    # Print summary (one write)
+    success = command.style.SUCCESS
+    summary = [
+        "",
+        success("=" * 60),
+        success("✅ BULK IMPORT COMPLETE!"),
+        success("=" * 60),
+        f"   📥 Imported:        {imported:,} new movies",
+        f"   ⏭️  Skipped (exist): {skipped_existing:,}",
+        f"   ⚠️  Skipped (invalid):{skipped_invalid:,}",
+    ]
     if skip_adult:
-        command.stdout.write(f"   🔞 Skipped (adult):  {skipped_adult:,}")
+        summary.append(f"   🔞 Skipped (adult):  {skipped_adult:,}")
     if min_popularity > 0:
-        command.stdout.write(f"   📉 Skipped (unpop.): {skipped_unpopular:,}")
-    command.stdout.write(f"   ⏱️  Time elapsed:    {elapsed:.1f} seconds")
-    command.stdout.write(f"   🚀 Import rate:     {rate:.0f} movies/second")
-    command.stdout.write(command.style.SUCCESS("=" * 60))
-    
-    # Total in database
-    total_db = Movie.objects.count()
-    command.stdout.write(f"\n📊 Total movies in database: {total_db:,}")
+        summary.append(f"   📉 Skipped (unpop.): {skipped_unpopular:,}")
+    summary += [
+        f"   ⏱️  Time elapsed:    {elapsed:.1f} seconds",
+        f"   🚀 Import rate:     {rate:.0f} movies/second",
+        success("=" * 60),
+        "",
+        # Total in database
+        f"📊 Total movies in database: {Movie.objects.count():,}",
+    ]
+    command.stdout.write("\n".join(summary))
     
     return imported, skipped_existing, processed
 
 
-def _bulk_create_batch(batch, command):
+# Temporary table that COPY loads before rows are merged into movies_movie
+COPY_STAGING_TABLE = 'movie_import_staging'
+
+# Escapes for PostgreSQL's COPY text format
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_value(value) -> str:
+    """Format one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _compile_copy_formatter(field_names: tuple):
+    """
+    Generate a formatter turning one row tuple into a COPY text line.
+    
+    The source is built once for the fixed column list, so each row costs
+    a single call with every field formatted inline in one f-string, instead
+    of a _copy_value call per field plus a join. Numeric columns skip the
+    escaping, since their text never contains tabs or backslashes.
+    """
+    numeric = {'IntegerField', 'PositiveIntegerField', 'FloatField', 'DecimalField'}
+    names = [f'v{i}' for i in range(len(field_names))]
+    parts = []
+    for name, field_name in zip(names, field_names):
+        if Movie._meta.get_field(field_name).get_internal_type() in numeric:
+            text = f'str({name})'
+        else:
+            text = f'str({name}).translate(escapes)'
+        parts.append(f'{{null if {name} is None else {text}}}')
+    fields = r'\t'.join(parts)
+    source = (
+        f'def format_copy_row(row, end):\n'
+        f'    {", ".join(names)}, = row\n'
+        f'    return f"{fields}{{end}}"\n'
+    )
+    namespace = {'escapes': _COPY_ESCAPES, 'null': '\\N'}
+    exec(source, namespace)
+    return namespace['format_copy_row']
+
+
+# format_copy_row(row, end) for IMPORT_FIELDS rows
+_format_copy_row = _compile_copy_formatter(IMPORT_FIELDS)
+
+
+def _movie_from_fields(fields: dict) -> Movie:
+    """Row builder for backends without COPY: a plain unsaved Movie."""
+    return Movie(**fields)
+
+
+def _copy_batch(batch) -> int:
+    """
+    Load a batch through COPY into a staging table, then merge it with
+    INSERT ... ON CONFLICT DO NOTHING (PostgreSQL only).
+    
+    The batch holds value tuples in IMPORT_FIELDS order.
+    Returns the number of movies inserted.
+    """
+    qn = connection.ops.quote_name
+    table = qn(Movie._meta.db_table)
+    staging = qn(COPY_STAGING_TABLE)
+    columns = ', '.join(
+        qn(Movie._meta.get_field(name).column)
+        for name in IMPORT_FIELDS + COPY_DEFAULT_FIELDS + ('created_at', 'updated_at')
+    )
+    
+    # Model defaults and auto_now/auto_now_add are filled here since no
+    # Movie.save() runs
+    defaults = ''.join(
+        f'\t{_copy_value(Movie._meta.get_field(name).get_default())}'
+        for name in COPY_DEFAULT_FIELDS
+    )
+    now = _copy_value(timezone.now())
+    row_end = f'{defaults}\t{now}\t{now}\n'
+    
+    buffer = io.StringIO()
+    format_row = _format_copy_row
+    buffer.writelines([format_row(row, row_end) for row in batch])
+    buffer.seek(0)
+    
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} AS "
+            f"SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        copy_sql = f"COPY {staging} ({columns}) FROM STDIN"
+        raw = cursor.cursor
+        if hasattr(raw, 'copy_expert'):  # psycopg2
+            raw.copy_expert(copy_sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+            f"ON CONFLICT DO NOTHING"
+        )
+        inserted = cursor.rowcount
+        cursor.execute(f"TRUNCATE {staging}")
+    return inserted
+
+
+def _drop_secondary_indexes(command) -> list:
+    """
+    Drop the non-unique indexes on the movies table.
+    
+    Unique and primary key indexes stay, so duplicate tmdb_ids are still
+    skipped. Returns the CREATE INDEX statements for _recreate_indexes.
+    """
+    table = Movie._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            # Automatic indexes (UNIQUE, PRIMARY KEY) have no SQL
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = %s AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%%'",
+                [table],
+            )
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s "
+                "AND indexdef NOT LIKE 'CREATE UNIQUE%%'",
+                [table],
+            )
+        else:
+            command.stdout.write(command.style.WARNING(
+                f"--drop-indexes is not supported on {connection.vendor}; keeping indexes"
+            ))
+            return []
+        indexes = cursor.fetchall()
+        
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+    
+    command.stdout.write(f"Dropped {len(indexes)} secondary indexes for the load")
+    return [sql for _, sql in indexes]
+
+
+def _recreate_indexes(statements: list, command) -> None:
+    """Recreate indexes dropped by _drop_secondary_indexes."""
+    if not statements:
+        return
+    command.stdout.write(f"\nRebuilding {len(statements)} indexes...")
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def _bulk_create_batch(batch, command) -> int:
     """
     Bulk create a batch of movies with conflict handling.
+    
+    PostgreSQL loads the batch with COPY (see _copy_batch); other
+    backends use bulk_create(ignore_conflicts=True).
+    
+    Returns the number of movies inserted (the batch size when the
+    backend cannot report skipped conflicts).
     """
-    try:
-        Movie.objects.bulk_create(
-            batch,
-            ignore_conflicts=True,  # Skip duplicates silently
-            batch_size=1000,
+    if len(batch) > MAX_BATCH:
+        return sum(
+            _bulk_create_batch(batch[start:start + MAX_BATCH], command)
+            for start in range(0, len(batch), MAX_BATCH)
         )
+    
+    try:
+        # A savepoint inside the writer's transaction: a failed batch is
+        # undone alone and the rows can still be retried below
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                return _copy_batch(batch)
+            Movie.objects.bulk_create(
+                batch,
+                ignore_conflicts=True,  # Skip duplicates silently
+                batch_size=1000,
+            )
+        return len(batch)
     except Exception as e:
         command.stdout.write(
             command.style.WARNING(f"\nBatch error (retrying individually): {e}")
         )
         # Fallback: try one by one
+        saved = 0
         for movie in batch:
+            if isinstance(movie, tuple):  # COPY row
+                movie = Movie(**dict(zip(IMPORT_FIELDS, movie)))
             try:
-                movie.save()
+                with transaction.atomic():
+                    movie.save()
+                saved += 1
             except Exception:
                 pass  # Skip individual failures
+        return saved
 
 
 # =============================================================================
 # LEGACY OMDB SINGLE IMPORT (preserved for compatibility)
 # =============================================================================
 
+# OMDB placeholders for a missing value
+_NA = frozenset({'N/A', '', None})
+
+# Movie field -> IMDBMovieData attribute for OMDB's plain text values
+OMDB_TEXT_FIELDS = {
+    'overview': 'plot',
+    'poster_path': 'poster',
+    'imdb_votes': 'imdb_votes',
+    'director': 'director',
+    'writer': 'writer',
+    'actors': 'actors',
+    'rated': 'rated',
+    'released': 'released',
+    'language': 'language',
+    'country': 'country',
+    'awards': 'awards',
+    'box_office': 'box_office',
+    'production': 'production',
+}
+
+# Per-movie progress lines buffered between writes to stdout
+OUTPUT_FLUSH_ROWS = 50
+
+# Movies per INSERT/UPDATE statement when saving OMDB results
+OMDB_WRITE_BATCH_SIZE = 500
+
+# Columns refreshed on existing movies by --update-existing
+OMDB_UPDATE_FIELDS = (
+    'genres', 'overview', 'poster_path', 'runtime', 'imdb_id', 'imdb_rating',
+    'imdb_votes', 'metascore', 'rotten_tomatoes', 'director', 'writer', 'actors',
+    'rated', 'released', 'language', 'country', 'awards', 'box_office',
+    'production', 'popularity', 'updated_at',
+)
+
 # Comprehensive list of popular movies across different genres and eras
 MOVIES_TO_IMPORT = [
     # Top Rated Classics
@@ -522,7 +962,7 @@ class Command(BaseCommand):
             '--batch-size',
             type=int,
             default=1000,
-            help='Batch size for bulk_create (default: 1000)',
+            help=f'Batch size for bulk_create, at most {MAX_BATCH:,} (default: 1000)',
         )
         parser.add_argument(
             '--min-popularity',
@@ -546,6 +986,22 @@ class Command(BaseCommand):
             action='store_true',
             help='Include unreleased movies (CSV only, default: released only)',
         )
+        parser.add_argument(
+            '--skip-preload',
+            action='store_true',
+            help='Do not load existing TMDB ids first; let the database skip duplicates',
+        )
+        parser.add_argument(
+            '--drop-indexes',
+            action='store_true',
+            help='Drop secondary indexes during the load and rebuild them afterwards',
+        )
+        parser.add_argument(
+            '--commit-every',
+            type=int,
+            default=DEFAULT_COMMIT_EVERY,
+            help=f'Movies per transaction during bulk import (default: {DEFAULT_COMMIT_EVERY:,})',
+        )
         parser.add_argument(
             '--download',
             action='store_true',
@@ -567,6 +1023,12 @@ class Command(BaseCommand):
             default=0.3,
             help='Delay between API requests in seconds (default: 0.3)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=10,
+            help='Number of concurrent API requests (default: 10)',
+        )
         parser.add_argument(
             '--update-existing',
             action='store_true',
@@ -634,13 +1096,16 @@ class Command(BaseCommand):
             min_popularity=options['min_popularity'],
             min_votes=options.get('min_votes', 0),
             only_released=not options.get('include_unreleased', False),
+            preload_existing=not options.get('skip_preload', False),
+            drop_indexes=options.get('drop_indexes', False),
+            commit_every=options.get('commit_every', DEFAULT_COMMIT_EVERY),
         )
     
     def _handle_omdb_import(self, options):
         """Handle legacy OMDB API import."""
-        from movies.services.external_apis import OMDBApiClient
+        from movies.services.external_apis import OMDBApiClient, RateLimiter
         
-        client = OMDBApiClient()
+        client = OMDBApiClient(throttle=RateLimiter(options['delay']).wait)
         
         if not client.api_key:
             self.stdout.write(self.style.ERROR(
@@ -662,124 +1127,179 @@ class Command(BaseCommand):
         
         self.stdout.write(self.style.HTTP_INFO(f'\n🎬 Importing {total} movies from IMDB via OMDB API...\n'))
         
-        for i, (title, year) in enumerate(movies_list, 1):
-            # Check if movie exists
-            existing = Movie.objects.filter(title__iexact=title, year=year).first()
-            
-            if existing and not options['update_existing']:
-                skipped += 1
-                self.stdout.write(f'[{i}/{total}] {title} ({year}) - skipped (exists)')
-                continue
-            
-            self.stdout.write(f'[{i}/{total}] Fetching: {title} ({year})... ', ending='')
-            
-            try:
-                # Fetch from OMDB
-                movie_data = client.search_by_title(title, year)
+        # (lowercased title, year) -> id of movies already stored, in one
+        # query instead of a lookup per movie (only the years we import can
+        # match); None marks movies created earlier in this run
+        known = {
+            (known_title.lower(), known_year): pk
+            for pk, known_title, known_year in Movie.objects.filter(
+                year__in={year for _, year in movies_list}
+            ).values_list('id', 'title', 'year').iterator()
+        }
+        
+        # Written in bulk after the loop instead of a save() per movie
+        to_create = []
+        to_update = []
+        
+        # OMDB lookups run ahead in worker threads, spaced out by the rate
+        # limiter; results are consumed in list order and all database
+        # writes stay on this thread
+        executor = ThreadPoolExecutor(max_workers=max(1, options['workers']))
+        fetches = {
+            i: executor.submit(client.search_by_title, title, year, year_fallback=True)
+            for i, (title, year) in enumerate(movies_list, 1)
+            if options['update_existing'] or (title.lower(), year) not in known
+        }
+        
+        # Per-movie lines are buffered and written OUTPUT_FLUSH_ROWS at a time
+        write = self.stdout.write
+        success, warning, error = self.style.SUCCESS, self.style.WARNING, self.style.ERROR
+        lines = []
+        out = lines.append
+        
+        try:
+            for i, (title, year) in enumerate(movies_list, 1):
+                if len(lines) >= OUTPUT_FLUSH_ROWS:
+                    write('\n'.join(lines))
+                    lines.clear()
                 
-                if not movie_data:
-                    # Try without year
-                    movie_data = client.search_by_title(title)
+                # Check if movie exists
+                key = (title.lower(), year)
+                exists = key in known
                 
-                if not movie_data:
-                    failed += 1
-                    self.stdout.write(self.style.WARNING('not found'))
+                if exists and (not options['update_existing'] or known[key] is None):
+                    skipped += 1
+                    if i in fetches:
+                        fetches[i].cancel()  # Listed twice; created earlier in this run
+                    out(f'[{i}/{total}] {title} ({year}) - skipped (exists)')
                     continue
                 
-                # Parse runtime (e.g., "142 min" -> 142)
-                runtime = None
-                if movie_data.runtime and movie_data.runtime != 'N/A':
-                    try:
-                        runtime = int(movie_data.runtime.replace(' min', '').strip())
-                    except ValueError:
-                        pass
-                
-                # Parse IMDB rating
-                imdb_rating = None
-                if movie_data.imdb_rating and movie_data.imdb_rating != 'N/A':
-                    try:
-                        imdb_rating = float(movie_data.imdb_rating)
-                    except ValueError:
-                        pass
-                
-                # Parse Metascore
-                metascore = None
-                if movie_data.metascore and movie_data.metascore != 'N/A':
-                    try:
-                        metascore = int(movie_data.metascore)
-                    except ValueError:
-                        pass
-                
-                # Get Rotten Tomatoes from ratings list
-                rotten_tomatoes = ''
-                for rating in movie_data.ratings:
-                    if rating.get('Source') == 'Rotten Tomatoes':
-                        rotten_tomatoes = rating.get('Value', '')
-                        break
+                line = f'[{i}/{total}] Fetching: {title} ({year})... '
                 
-                # Calculate popularity score based on IMDB data
-                popularity = 0.0
-                if imdb_rating:
-                    popularity = imdb_rating * 10
-                
-                # Prepare movie data
-                movie_fields = {
-                    'genres': movie_data.genre,
-                    'overview': movie_data.plot if movie_data.plot != 'N/A' else '',
-                    'poster_path': movie_data.poster if movie_data.poster != 'N/A' else '',
-                    'runtime': runtime,
-                    'imdb_id': movie_data.imdb_id,
-                    'imdb_rating': imdb_rating,
-                    'imdb_votes': movie_data.imdb_votes if movie_data.imdb_votes != 'N/A' else '',
-                    'metascore': metascore,
-                    'rotten_tomatoes': rotten_tomatoes,
-                    'director': movie_data.director if movie_data.director != 'N/A' else '',
-                    'writer': movie_data.writer if movie_data.writer != 'N/A' else '',
-                    'actors': movie_data.actors if movie_data.actors != 'N/A' else '',
-                    'rated': movie_data.rated if movie_data.rated != 'N/A' else '',
-                    'released': movie_data.released if movie_data.released != 'N/A' else '',
-                    'language': movie_data.language if movie_data.language != 'N/A' else '',
-                    'country': movie_data.country if movie_data.country != 'N/A' else '',
-                    'awards': movie_data.awards if movie_data.awards != 'N/A' else '',
-                    'box_office': movie_data.box_office if movie_data.box_office != 'N/A' else '',
-                    'production': movie_data.production if movie_data.production != 'N/A' else '',
-                    'popularity': popularity,
-                }
-                
-                if existing:
-                    # Update existing movie
-                    for field, value in movie_fields.items():
-                        setattr(existing, field, value)
-                    existing.save()
-                    updated += 1
-                    self.stdout.write(self.style.WARNING('updated'))
-                else:
-                    # Create new movie
-                    Movie.objects.create(
-                        title=movie_data.title,
-                        year=int(movie_data.year) if movie_data.year.isdigit() else year,
-                        **movie_fields
+                try:
+                    # Wait for the prefetched OMDB lookup (retries without year on a miss)
+                    movie_data = fetches[i].result()
+                    
+                    if not movie_data:
+                        failed += 1
+                        out(line + warning('not found'))
+                        continue
+                    
+                    # Parse runtime (e.g., "142 min" -> 142)
+                    runtime = None
+                    if movie_data.runtime not in _NA:
+                        try:
+                            runtime = int(movie_data.runtime.replace(' min', '').strip())
+                        except ValueError:
+                            pass
+                    
+                    # Parse IMDB rating
+                    imdb_rating = None
+                    if movie_data.imdb_rating not in _NA:
+                        try:
+                            imdb_rating = float(movie_data.imdb_rating)
+                        except ValueError:
+                            pass
+                    
+                    # Parse Metascore
+                    metascore = None
+                    if movie_data.metascore not in _NA:
+                        try:
+                            metascore = int(movie_data.metascore)
+                        except ValueError:
+                            pass
+                    
+                    # Get Rotten Tomatoes from ratings list
+                    rotten_tomatoes = ''
+                    for rating in movie_data.ratings:
+                        if rating.get('Source') == 'Rotten Tomatoes':
+                            rotten_tomatoes = rating.get('Value', '')
+                            break
+                    
+                    # Calculate popularity score based on IMDB data
+                    popularity = 0.0
+                    if imdb_rating:
+                        popularity = imdb_rating * 10
+                    
+                    # Prepare movie data (OMDB text fields, 'N/A' -> '')
+                    movie_fields = {
+                        field: '' if value in _NA else value
+                        for field, value in zip(
+                            OMDB_TEXT_FIELDS, attrgetter(*OMDB_TEXT_FIELDS.values())(movie_data)
+                        )
+                    }
+                    movie_fields.update(
+                        genres=movie_data.genre,
+                        imdb_id=movie_data.imdb_id,
+                        runtime=runtime,
+                        imdb_rating=imdb_rating,
+                        metascore=metascore,
+                        rotten_tomatoes=rotten_tomatoes,
+                        popularity=popularity,
                     )
-                    created += 1
-                    self.stdout.write(self.style.SUCCESS('✓ imported'))
-                
-            except Exception as e:
-                failed += 1
-                self.stdout.write(self.style.ERROR(f'error: {e}'))
+                    
+                    if exists:
+                        # Update existing movie (no fetch needed, only the id)
+                        to_update.append(Movie(pk=known[key], **movie_fields))
+                        updated += 1
+                        out(line + warning('updated'))
+                    else:
+                        # Create new movie
+                        to_create.append(Movie(
+                            title=movie_data.title,
+                            year=int(movie_data.year) if movie_data.year.isdigit() else year,
+                            **movie_fields
+                        ))
+                        known[key] = None
+                        created += 1
+                        out(line + success('✓ imported'))
+                    
+                except Exception as e:
+                    failed += 1
+                    out(line + error(f'error: {e}'))
+        
+        finally:
+            if lines:
+                write('\n'.join(lines))
+            
+            # Don't let an interrupted run keep fetching in the background
+            executor.shutdown(cancel_futures=True)
             
-            # Rate limiting
-            time.sleep(options['delay'])
+            # Save what was fetched, even after an interrupt
+            self._save_omdb_movies(to_create, to_update)
         
         # Summary
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('=' * 50))
-        self.stdout.write(self.style.SUCCESS(f'✅ Import complete!'))
-        self.stdout.write(f'   Created: {created} new movies')
-        self.stdout.write(f'   Updated: {updated} existing movies')
-        self.stdout.write(f'   Skipped: {skipped} (already exist)')
+        summary = [
+            '',
+            success('=' * 50),
+            success(f'✅ Import complete!'),
+            f'   Created: {created} new movies',
+            f'   Updated: {updated} existing movies',
+            f'   Skipped: {skipped} (already exist)',
+        ]
         if failed:
-            self.stdout.write(self.style.WARNING(f'   Failed:  {failed} movies'))
-        self.stdout.write(self.style.SUCCESS('=' * 50))
-        self.stdout.write('')
-        self.stdout.write(f'Total movies in database: {Movie.objects.count()}')
-
+            summary.append(warning(f'   Failed:  {failed} movies'))
+        summary += [
+            success('=' * 50),
+            '',
+            f'Total movies in database: {Movie.objects.count()}',
+        ]
+        write('\n'.join(summary))
+    
+    @staticmethod
+    def _save_omdb_movies(to_create: list, to_update: list):
+        """Insert and update the OMDB import's movies in batches, in one transaction."""
+        now = timezone.now()
+        for movie in to_update:
+            movie.updated_at = now  # bulk_update skips auto_now
+        
+        with transaction.atomic():
+            Movie.objects.bulk_create(to_create, batch_size=OMDB_WRITE_BATCH_SIZE)
+            if to_update:
+                Movie.objects.bulk_update(
+                    to_update, OMDB_UPDATE_FIELDS, batch_size=OMDB_WRITE_BATCH_SIZE
+                )
+        
+        # Bulk writes skip the genre-link signal
+        Genre.sync_movies((movie.pk, movie.genres) for movie in to_update)
+        Genre.sync_unlinked()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_alter_movie_options_movie_actors_movie_awards_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['popularity'], name='movies_movi_popular_114287_idx'),
+        ),
+    ]
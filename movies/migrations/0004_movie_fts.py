@@ -0,0 +1,59 @@
+# Full-text index on movie titles (SQLite FTS5)
+
+from django.db import migrations
+
+
+FTS_SQL = [
+    # External-content table: stores only the index, rows live in movies_movie
+    "CREATE VIRTUAL TABLE movie_fts USING fts5("
+    "title, content='movies_movie', content_rowid='id')",
+    # Keep the index in sync with movies_movie
+    "CREATE TRIGGER movie_fts_ai AFTER INSERT ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER movie_fts_ad AFTER DELETE ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER movie_fts_au AFTER UPDATE OF title ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END",
+    # Index the rows that already exist
+    "INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS movie_fts_ai",
+    "DROP TRIGGER IF EXISTS movie_fts_ad",
+    "DROP TRIGGER IF EXISTS movie_fts_au",
+    "DROP TABLE IF EXISTS movie_fts",
+]
+
+
+def _has_fts5(connection) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any('FTS5' in row[0] for row in cursor.fetchall())
+
+
+def create_fts(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite' or not _has_fts5(connection):
+        return  # Movie.search_by_title falls back to icontains
+    for sql in FTS_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_movie_popularity_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:45
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 2000
+
+
+def link_genres(apps, schema_editor):
+    """Split every movie's genres string into Genre rows and links."""
+    Movie = apps.get_model('movies', 'Movie')
+    Genre = apps.get_model('movies', 'Genre')
+    Link = Movie.genres_m2m.through
+
+    genre_ids = {}  # name -> id
+    rows = Movie.objects.exclude(genres='').order_by('pk').values_list('pk', 'genres')
+    last_pk = 0
+    while True:
+        page = list(rows.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not page:
+            return
+        last_pk = page[-1][0]
+
+        parsed = [
+            (movie_id, dict.fromkeys(g.strip().title()[:100] for g in genres.split(',') if g.strip()))
+            for movie_id, genres in page
+        ]
+        new_names = {name for _, names in parsed for name in names} - genre_ids.keys()
+        if new_names:
+            Genre.objects.bulk_create([Genre(name=name) for name in new_names])
+            genre_ids.update(Genre.objects.filter(name__in=new_names).values_list('name', 'id'))
+
+        Link.objects.bulk_create([
+            Link(movie_id=movie_id, genre_id=genre_ids[name])
+            for movie_id, names in parsed
+            for name in names
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_movie_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='genres_m2m',
+            field=models.ManyToManyField(blank=True, related_name='movies', to='movies.genre'),
+        ),
+        migrations.RunPython(link_genres, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:49
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_rating_stats(apps, schema_editor):
+    """Store each movie's current average rating and rating count."""
+    Movie = apps.get_model('movies', 'Movie')
+    Rating = apps.get_model('movies', 'Rating')
+
+    per_movie = Rating.objects.filter(movie=OuterRef('pk')).order_by().values('movie')
+    Movie.objects.filter(ratings__isnull=False).distinct().update(
+        avg_rating_cached=Coalesce(Subquery(per_movie.annotate(avg=Avg('stars')).values('avg')), Value(0.0)),
+        rating_count_cached=Coalesce(Subquery(per_movie.annotate(n=Count('pk')).values('n')), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_genre'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='avg_rating_cached',
+            field=models.FloatField(db_index=True, default=0.0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='rating_count_cached',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_rating_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Restore the movie_fts triggers dropped by 0006
+#
+# On SQLite, AddField with a default remakes movies_movie, and the remake
+# loses the raw triggers 0004 created on it.
+
+from django.db import migrations
+
+
+TRIGGER_SQL = [
+    "DROP TRIGGER IF EXISTS movie_fts_ai",
+    "DROP TRIGGER IF EXISTS movie_fts_ad",
+    "DROP TRIGGER IF EXISTS movie_fts_au",
+    "CREATE TRIGGER movie_fts_ai AFTER INSERT ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END",
+    "CREATE TRIGGER movie_fts_ad AFTER DELETE ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); END",
+    "CREATE TRIGGER movie_fts_au AFTER UPDATE OF title ON movies_movie BEGIN "
+    "INSERT INTO movie_fts(movie_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+    "INSERT INTO movie_fts(rowid, title) VALUES (new.id, new.title); END",
+    # Re-index rows written while the triggers were missing
+    "INSERT INTO movie_fts(movie_fts) VALUES ('rebuild')",
+]
+
+
+def restore_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite':
+        return
+    if 'movie_fts' not in connection.introspection.table_names():
+        return  # 0004 skipped FTS (no FTS5 support)
+    for sql in TRIGGER_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_movie_rating_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(restore_triggers, migrations.RunPython.noop),
+    ]
@@ -11,17 +11,34 @@ Demonstrates:
 - For loops and while loops
 - If/else conditional logic
 - Lambdas for sorting
-- SciPy for distance calculations
+- SciPy sparse matrices
 """
 
 import numpy as np
-from scipy import spatial
+from scipy import sparse
 from scipy import stats as scipy_stats
 from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from typing import Dict, List, Tuple, Optional, Iterator, Any
-from collections import defaultdict
+from functools import partial
+from joblib import Parallel, delayed
+import threading
+
+
+# Numeric feature columns, in matrix order after the genre one-hot block:
+# (feature_config key, Movie field, value used when the field is empty)
+NUMERIC_FEATURES = (
+    ('use_popularity', 'popularity', 0.0),
+    ('use_year', 'year', 2000.0),
+    ('use_runtime', 'runtime', 120.0),
+)
+
+# Movies per round trip when streaming values() rows
+ITERATOR_CHUNK_SIZE = 2000
+
+# Feature-matrix rows scored per block in get_similar_movies
+SIMILARITY_CHUNK_ROWS = 65536
 
 
 class MovieRecommender:
@@ -43,6 +60,12 @@ class MovieRecommender:
         self.scaler = StandardScaler()
         self.is_trained = False
         
+        # Scaler folded into the model: predict(X) == X @ _w_fused + _b_fused
+        self._w_fused = None  # np.ndarray (D,)
+        self._b_fused = 0.0
+        self._predict_fn = None  # clipped X -> ratings, bound to the fused weights
+        self._row_scores = None  # np.ndarray (N,) predicted rating per cache row
+        
         # Feature configuration - dict
         self.feature_config = {
             'use_genres': True,
@@ -55,7 +78,16 @@ class MovieRecommender:
         self._genre_encoder = {}  # dict: genre -> index
         self._all_genres = []  # list of genres
         self._user_profile = {}  # dict for user preferences
-        self._movie_features = {}  # dict: movie_id -> feature vector
+        self._rated_ids = {}  # dict: user pk -> set of rated movie ids
+        
+        # Feature cache in SoA layout: one contiguous matrix, one row per movie
+        self._feature_matrix = None  # np.ndarray (N, D)
+        self._normalized_matrix = None  # unit-length rows, built on first similarity search
+        self._feature_pks = None  # np.ndarray (N,) movie pk of each row
+        self._pk_to_row = {}  # dict: movie_id -> row index
+        self._genre_offsets = None  # np.ndarray (N + 1,) into _genre_cols
+        self._genre_cols = None  # np.ndarray: genre indices of every row, concatenated
+        self._row_extractor = None  # values() row -> feature vector, see _compile_extractor
     
     def __str__(self) -> str:
         """
@@ -77,10 +109,10 @@ class MovieRecommender:
         # Collect all genres using set
         all_genres_set = set()  # set for unique genres
         
-        # For loop over movies
-        for movie in Movie.objects.all():
-            genres = movie.get_genres_set()  # set of genres
-            all_genres_set |= genres  # set union
+        # For loop over each distinct genres string (no model instances)
+        genre_strings = Movie.objects.order_by().values_list('genres', flat=True).distinct()
+        for genres in genre_strings.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            all_genres_set.update(_parse_genres(genres))  # set union
         
         # Sort and create encoder
         self._all_genres = sorted(all_genres_set)  # list
@@ -91,54 +123,157 @@ class MovieRecommender:
             for idx, genre in enumerate(self._all_genres)
         }
     
-    def _encode_genres(self, genres: List[str]) -> np.ndarray:
+    def _genre_indices(self, genres: List[str]) -> List[int]:
         """
-        One-hot encode genres.
+        Encoder indices of the known genres in a list.
         
-        Demonstrates: NumPy array creation, for loop
+        Demonstrates: Generator expression, filtered list comprehension
         """
-        # Create zero array
-        encoding = np.zeros(len(self._all_genres), dtype=np.float64)
+        encoder = self._genre_encoder
+        normalized = (genre.strip().title() for genre in genres)
+        return [encoder[genre] for genre in normalized if genre in encoder]
+    
+    def _extract_movie_features(self, movie) -> np.ndarray:
+        """
+        Feature vector for a movie, read from the cache when possible.
         
-        # For loop to set genre flags
-        for genre in genres:
-            genre_normalized = genre.strip().title()
-            if genre_normalized in self._genre_encoder:
-                idx = self._genre_encoder[genre_normalized]
-                encoding[idx] = 1.0
+        Demonstrates: Dict lookup, if/else
+        """
+        row = self._pk_to_row.get(movie.pk)
+        if row is not None:
+            return self._feature_matrix[row]
         
-        return encoding
+        return self._extract_row_features({
+            'genres': movie.genres,
+            'popularity': movie.popularity,
+            'year': movie.year,
+            'runtime': movie.runtime,
+        })
     
-    def _extract_movie_features(self, movie) -> np.ndarray:
+    def _extract_row_features(self, row: Dict[str, Any]) -> np.ndarray:
         """
-        Extract feature vector for a movie.
+        Extract feature vector from a movie values() row.
         
-        Demonstrates: NumPy array operations, if/else, 
-                     feature engineering
+        Demonstrates: Compiled closures, lazy initialization
         """
-        features = []  # list to build features
+        if self._row_extractor is None:
+            self._row_extractor = self._compile_extractor()
         
-        # Genre features (one-hot encoded)
-        if self.feature_config['use_genres']:
-            genre_encoding = self._encode_genres(movie.get_genres_list())
-            features.extend(genre_encoding.tolist())
+        out = np.empty(self._row_extractor.width, dtype=np.float64)
+        self._row_extractor(row, out)
+        return out
+    
+    def _numeric_features(self) -> List[Tuple[str, float]]:
+        """
+        (field, default) of each enabled numeric feature, in column order.
         
-        # Popularity feature (normalized)
-        if self.feature_config['use_popularity']:
-            popularity = float(movie.popularity) if movie.popularity else 0.0
-            features.append(popularity)
+        Demonstrates: Filtered list comprehension, tuple unpacking
+        """
+        return [
+            (field, default)
+            for key, field, default in NUMERIC_FEATURES
+            if self.feature_config[key]
+        ]
+    
+    def _compile_extractor(self):
+        """
+        Resolve feature_config into a function writing a row's features.
         
-        # Year feature (normalized)
-        if self.feature_config['use_year']:
-            year = float(movie.year) if movie.year else 2000.0
-            features.append(year)
+        The config flags, column positions and vector width are decided
+        here, once, so the returned closure runs no config branches. It
+        fills a caller-supplied (width,) buffer in place, allocating
+        nothing per movie; the width is exposed as its .width attribute.
         
-        # Runtime feature
-        if self.feature_config['use_runtime']:
-            runtime = float(movie.runtime) if movie.runtime else 120.0
-            features.append(runtime)
+        Demonstrates: Closures, function attributes, in-place writes
+        """
+        n_genres = len(self._all_genres) if self.feature_config['use_genres'] else 0
+        numeric = [
+            (col, field, default)
+            for col, (field, default) in enumerate(self._numeric_features(), n_genres)
+        ]
+        width = n_genres + len(numeric)
+        genre_indices = self._genre_indices if n_genres else None
         
-        return np.array(features, dtype=np.float64)
+        def extract(row: Dict[str, Any], out: np.ndarray) -> None:
+            out[:n_genres] = 0.0
+            
+            # Genre features (one-hot encoded)
+            if genre_indices is not None and row['genres']:
+                out[genre_indices(row['genres'].split(','))] = 1.0
+            
+            # Numeric features: popularity, year, runtime
+            for col, field, default in numeric:
+                value = row[field]
+                out[col] = float(value) if value else default
+        
+        extract.width = width
+        return extract
+    
+    def _build_feature_cache(self) -> None:
+        """
+        Cache features of every movie as one (N, D) matrix.
+        
+        Rows come from values() dicts, so no model instances are built;
+        _pk_to_row maps a movie pk to its row. Genre strings are parsed
+        into encoder indices once, kept CSR-style (row i's genres are
+        _genre_cols[_genre_offsets[i]:_genre_offsets[i + 1]]) and set
+        in the one-hot block with one fancy-index assignment. Each
+        numeric feature is written as a whole column.
+        
+        Demonstrates: SoA layout, NumPy fancy indexing, dict comprehension
+        """
+        from movies.models import Movie
+        
+        self._pk_to_row = {}  # Reset first: lookups must not hit the old matrix
+        self._row_extractor = self._compile_extractor()  # Same layout as the matrix
+        
+        n_genres = len(self._all_genres) if self.feature_config['use_genres'] else 0
+        numeric = self._numeric_features()
+        
+        pks = []  # movie pk per row
+        genre_counts = []  # number of known genres per row
+        col_idx = []  # genre columns of all rows, concatenated
+        columns = [[] for _ in numeric]  # one value list per numeric feature
+        
+        # Many movies share a genres string: parse each distinct one once
+        parsed = {'': [], None: []}  # dict: genres string -> genre columns
+        
+        # Single streaming pass over values() rows
+        rows = Movie.objects.values('pk', 'genres', 'popularity', 'year', 'runtime')
+        for row in rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            pks.append(row['pk'])
+            
+            genres = row['genres']
+            cols = parsed.get(genres)
+            if cols is None:
+                cols = parsed[genres] = self._genre_indices(genres.split(','))
+            genre_counts.append(len(cols))
+            col_idx.extend(cols)
+            
+            for values, (field, default) in zip(columns, numeric):
+                value = row[field]
+                values.append(float(value) if value else default)
+        
+        self._genre_cols = np.array(col_idx, dtype=np.intp)
+        self._genre_offsets = np.zeros(len(pks) + 1, dtype=np.intp)
+        np.cumsum(genre_counts, out=self._genre_offsets[1:])
+        
+        matrix = np.zeros((len(pks), n_genres + len(numeric)), dtype=np.float64)
+        
+        # Genre one-hot block: set every (row, genre) pair at once
+        if n_genres:
+            row_idx = np.repeat(np.arange(len(pks)), genre_counts)
+            matrix[row_idx, self._genre_cols] = 1.0
+        
+        # Numeric features, one column at a time
+        for col, values in enumerate(columns, n_genres):
+            matrix[:, col] = values
+        
+        self._feature_pks = np.array(pks, dtype=np.int64)
+        self._feature_matrix = matrix
+        self._normalized_matrix = None  # Normalized from the old matrix
+        self._row_scores = None  # Predicted from the old matrix
+        self._pk_to_row = {pk: i for i, pk in enumerate(self._feature_pks.tolist())}
     
     def train(self, user=None) -> Dict[str, Any]:
         """
@@ -149,19 +284,28 @@ class MovieRecommender:
         """
         from movies.models import Rating, Movie
         
-        # Build genre encoder first
+        # Build genre encoder first, then encode every movie with it
         self._build_genre_encoder()
+        self._build_feature_cache()
         
         if not self._all_genres:
             return {'success': False, 'error': 'No genres found'}
         
-        # Get ratings
+        # Get ratings as (movie_id, stars) tuples
         if user:
-            ratings = Rating.objects.filter(user=user).select_related('movie')
+            ratings = Rating.objects.filter(user=user)
         else:
-            ratings = Rating.objects.all().select_related('movie')
+            ratings = Rating.objects.all()
         
-        ratings_list = list(ratings)
+        all_ratings = list(ratings.values_list('movie_id', 'stars'))
+        
+        # Remember what the user rated: the recommendation calls need it too
+        self._rated_ids = {}
+        if user:
+            self._rated_ids[user.pk] = {movie_id for movie_id, _ in all_ratings}
+        
+        pk_to_row = self._pk_to_row
+        ratings_list = [rating for rating in all_ratings if rating[0] in pk_to_row]
         
         # If/else: Check minimum ratings
         if len(ratings_list) < 3:
@@ -170,22 +314,10 @@ class MovieRecommender:
                 'error': f'Need at least 3 ratings, have {len(ratings_list)}',
             }
         
-        # Build feature matrix and target vector
-        X_list = []  # list for feature vectors
-        y_list = []  # list for ratings
-        
-        # For loop over ratings
-        for rating in ratings_list:
-            features = self._extract_movie_features(rating.movie)
-            X_list.append(features)
-            y_list.append(float(rating.stars))
-            
-            # Cache movie features
-            self._movie_features[rating.movie.pk] = features
-        
-        # Convert to NumPy arrays
-        X = np.array(X_list, dtype=np.float64)  # Feature matrix
-        y = np.array(y_list, dtype=np.float64)  # Target vector
+        # Build feature matrix (cached rows) and target vector
+        rows = np.array([pk_to_row[movie_id] for movie_id, _ in ratings_list], dtype=np.intp)
+        X = self._feature_matrix[rows]  # Feature matrix
+        y = np.array([stars for _, stars in ratings_list], dtype=np.float64)  # Target vector
         
         # Scale features
         X_scaled = self.scaler.fit_transform(X)
@@ -193,12 +325,13 @@ class MovieRecommender:
         # Train linear regression model
         self.model = Ridge(alpha=self.alpha)
         self.model.fit(X_scaled, y)
+        self._fuse_scaler()
         
         self.is_trained = True
         
         # Build user profile from ratings
         if user:
-            self._build_user_profile(ratings_list)
+            self._build_user_profile(rows, y)
         
         # Calculate training metrics
         y_pred = self.model.predict(X_scaled)
@@ -213,29 +346,66 @@ class MovieRecommender:
             'r2_score': round(r2, 4),
         }
     
-    def _build_user_profile(self, ratings: List) -> None:
+    def _fuse_scaler(self) -> None:
         """
-        Build user preference profile.
+        Fold the scaler into the Ridge weights.
+        
+        model.predict(scaler.transform(X)) is
+        ((X - mean) / scale) @ coef + intercept, which equals
+        X @ (coef / scale) + (intercept - (coef * mean / scale).sum()),
+        so predictions become one matrix-vector product on raw features
+        with no (N, D) temporaries.
         
-        Demonstrates: Dict aggregation, for loops, calculations
+        Demonstrates: Linear algebra, NumPy broadcasting
         """
-        genre_ratings = defaultdict(list)  # dict: genre -> list of ratings
+        weights = self.model.coef_ / self.scaler.scale_
+        self._w_fused = weights
+        self._b_fused = float(self.model.intercept_ - np.dot(weights, self.scaler.mean_))
+        self._predict_fn = partial(_predict_numpy, w=self._w_fused, b=self._b_fused)
+        self._row_scores = None  # Predicted with the old weights
+    
+    def _build_user_profile(self, rows: np.ndarray, stars: np.ndarray) -> None:
+        """
+        Build user preference profile from rated cache rows and their stars.
         
-        # For loop to aggregate by genre
-        for rating in ratings:
-            genres = rating.movie.get_genres_list()
-            for genre in genres:
-                genre_ratings[genre].append(rating.stars)
+        The pre-parsed genre indices of the rated rows are gathered into
+        one flat array (each rating's stars repeated per genre), then
+        np.bincount computes every genre's count, sum and squared
+        deviations in one pass each. No genre strings are parsed here.
         
-        # Calculate average per genre
+        Demonstrates: np.repeat, np.bincount, vectorized statistics
+        """
         self._user_profile = {}
-        for genre, stars_list in genre_ratings.items():
-            # NumPy mean
-            avg = float(np.mean(stars_list))
-            self._user_profile[genre] = {
-                'mean': round(avg, 2),
-                'count': len(stars_list),
-                'std': round(float(np.std(stars_list)), 2),
+        
+        starts = self._genre_offsets[rows]
+        lengths = self._genre_offsets[rows + 1] - starts
+        if not lengths.sum():
+            return
+        
+        # Flat (genre, stars) pairs, one per genre of each rated movie
+        g = np.concatenate([
+            self._genre_cols[start:start + length]
+            for start, length in zip(starts.tolist(), lengths.tolist())
+        ])
+        pair_stars = np.repeat(stars, lengths)
+        n_genres = len(self._all_genres)
+        
+        # Per-genre count, mean and (population) standard deviation
+        counts = np.bincount(g, minlength=n_genres)
+        safe_counts = np.maximum(counts, 1)  # unrated genres are never read
+        means = np.bincount(g, weights=pair_stars, minlength=n_genres) / safe_counts
+        squared_deviations = (pair_stars - means[g]) ** 2
+        stds = np.sqrt(np.bincount(g, weights=squared_deviations, minlength=n_genres) / safe_counts)
+        
+        # Genres in first-seen order, like the insertion order of a dict
+        uniques, first_seen = np.unique(g, return_index=True)
+        order = uniques[np.argsort(first_seen)]
+        
+        for i in order.tolist():
+            self._user_profile[self._all_genres[i]] = {
+                'mean': round(float(means[i]), 2),
+                'count': int(counts[i]),
+                'std': round(float(stds[i]), 2),
             }
     
     def predict(self, movie) -> float:
@@ -250,19 +420,99 @@ class MovieRecommender:
         # Extract features
         features = self._extract_movie_features(movie)
         
-        # Reshape for prediction (1 sample)
-        X = features.reshape(1, -1)
+        # Predict with the fused scaler + model weights, clipped to 0.5-5
+        prediction = float(self._predict_fn(features))
         
-        # Scale
-        X_scaled = self.scaler.transform(X)
+        return round(prediction, 2)
+    
+    def _predict_rows(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Predicted ratings for cached feature rows.
         
-        # Predict
-        prediction = self.model.predict(X_scaled)[0]
+        Every cached movie is scored once, with one matrix-vector
+        product, the first time any rows are needed; later calls (the
+        recommendation list and each genre list) just index the result.
+        train() and _build_feature_cache() drop the memoized scores.
         
-        # Clip to valid range
-        prediction = float(np.clip(prediction, 0.5, 5.0))
+        Demonstrates: Memoization, NumPy fancy indexing, batched inference
+        """
+        if not self.is_trained:
+            return np.full(len(rows), 3.0)
         
-        return round(prediction, 2)
+        return self._scored_rows()[rows]
+    
+    def _scored_rows(self) -> np.ndarray:
+        """
+        Memoized predicted rating of every cache row (model must be trained).
+        
+        Demonstrates: Memoization, lazy initialization
+        """
+        if self._row_scores is None:
+            self._row_scores = np.round(self._predict_fn(self._feature_matrix), 2)
+        
+        return self._row_scores
+    
+    def _get_rated_ids(self, user) -> set:
+        """
+        Set of movie ids the user has rated, memoized per recommender.
+        
+        train(user) fills the memo from the ratings it already fetched,
+        so the usual train / get_recommendations /
+        get_genre_based_recommendations sequence costs one query.
+        
+        Demonstrates: Memoization with a dict, set comprehension
+        """
+        from movies.models import Rating
+        
+        rated_ids = self._rated_ids.get(user.pk)
+        if rated_ids is None:
+            rated_ids = self._rated_ids[user.pk] = set(
+                Rating.objects.filter(user=user).values_list('movie_id', flat=True)
+            )
+        return rated_ids
+    
+    def _unrated_mask(self, user) -> np.ndarray:
+        """
+        Boolean mask over cache rows, True where the user has not rated.
+        
+        Demonstrates: NumPy boolean masks, fancy-index assignment
+        """
+        pk_to_row = self._pk_to_row
+        rated_rows = [pk_to_row[pk] for pk in self._get_rated_ids(user) if pk in pk_to_row]
+        
+        mask = np.ones(len(self._feature_pks), dtype=bool)
+        mask[rated_rows] = False
+        return mask
+    
+    def _candidate_rows(self, queryset) -> np.ndarray:
+        """
+        Cache rows of the movies in a queryset, in queryset order.
+        
+        Demonstrates: values_list, list comprehension, NumPy arrays
+        """
+        pk_to_row = self._pk_to_row
+        pks = queryset.values_list('pk', flat=True).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+        return np.array([pk_to_row[pk] for pk in pks if pk in pk_to_row], dtype=np.intp)
+    
+    def _top_movies(self, rows: np.ndarray, scores: np.ndarray, n: int) -> List[Tuple[Any, float]]:
+        """
+        Fetch the n best-scoring movies as (movie, score) tuples.
+        
+        Only the winners become model instances, in one in_bulk query.
+        
+        Demonstrates: in_bulk, zip, list comprehension
+        """
+        from movies.models import Movie
+        
+        best = _top_n_indices(scores, n)
+        pks = self._feature_pks[rows[best]].tolist()
+        movies = Movie.objects.in_bulk(pks)
+        
+        return [
+            (movies[pk], float(score))
+            for pk, score in zip(pks, scores[best])
+            if pk in movies
+        ]
     
     def get_recommendations(
         self,
@@ -272,29 +522,19 @@ class MovieRecommender:
         """
         Get movie recommendations.
         
-        Demonstrates: Custom iterator usage, lambda sorting
+        Demonstrates: Custom iterator usage, boolean masks, top-N selection
         """
-        from movies.models import Movie, Rating
+        if self._feature_matrix is None:
+            self._build_feature_cache()
         
-        # Get movies user hasn't rated
-        rated_ids = set(
-            Rating.objects.filter(user=user).values_list('movie_id', flat=True)
-        )
-        
-        unrated_movies = Movie.objects.exclude(pk__in=rated_ids)
-        
-        # Score all unrated movies
-        scored_movies = []  # list of (movie, score) tuples
+        # Get movies user hasn't rated: no DB round trip, just a mask
+        rows = np.flatnonzero(self._unrated_mask(user))
         
-        for movie in unrated_movies:
-            score = self.predict(movie)
-            scored_movies.append((movie, score))
+        # Score all unrated movies in one batch
+        scores = self._predict_rows(rows)
         
-        # Sort by score using lambda
-        scored_movies.sort(key=lambda x: x[1], reverse=True)
-        
-        # Take top N
-        top_recommendations = scored_movies[:n_recommendations]
+        # Take top N without sorting every candidate
+        top_recommendations = self._top_movies(rows, scores, n_recommendations)
         
         # Return as iterator
         return RecommendationIterator(top_recommendations)
@@ -307,41 +547,66 @@ class MovieRecommender:
         """
         Get recommendations organized by genre.
         
-        Demonstrates: Dict of lists, for loops, lambda
+        The genres are independent, so each one's query and scoring runs
+        in its own thread (the work is DB round trips and NumPy, both of
+        which release the GIL); all threads share the feature cache.
+        
+        Demonstrates: Dict of lists, joblib thread parallelism, boolean masks
         """
-        from movies.models import Movie, Rating
+        if self._feature_matrix is None:
+            self._build_feature_cache()
         
-        # Get rated movie IDs
-        rated_ids = set(
-            Rating.objects.filter(user=user).values_list('movie_id', flat=True)
-        )
+        # Cache rows the user hasn't rated
+        unrated = self._unrated_mask(user)
         
         # Get user's top genres
-        top_genres = sorted(
-            self._user_profile.items(),
-            key=lambda x: x[1]['mean'],
-            reverse=True
-        )[:5]
+        genres = list(self._user_profile)
+        genre_means = np.array([self._user_profile[genre]['mean'] for genre in genres])
+        top_genres = [genres[i] for i in _top_n_indices(genre_means, 5)]
+        
+        if not top_genres:
+            return {}
+        
+        # Score the catalogue once up front, not once per thread
+        if self.is_trained:
+            self._scored_rows()
+        
+        caller = threading.get_ident()
+        results = Parallel(n_jobs=len(top_genres), prefer='threads')(
+            delayed(self._score_genre)(genre, unrated, n_per_genre, caller)
+            for genre in top_genres
+        )
         
-        genre_recommendations = {}  # dict: genre -> list of (movie, score)
+        # dict: genre -> list of (movie, score), in top-genre order
+        return dict(zip(top_genres, results))
+    
+    def _score_genre(
+        self,
+        genre: str,
+        unrated: np.ndarray,
+        n_per_genre: int,
+        caller: int
+    ) -> List[Tuple[Any, float]]:
+        """
+        Best unrated movies of one genre (runs in a joblib worker thread).
         
-        # For each top genre
-        for genre, _ in top_genres:
+        Demonstrates: try/finally, per-thread DB connections
+        """
+        from django.db import connection
+        from movies.models import Movie
+        
+        try:
             # Get unrated movies in this genre
-            movies = Movie.objects.filter(
-                genres__icontains=genre
-            ).exclude(pk__in=rated_ids)
-            
-            # Score and sort
-            scored = [
-                (movie, self.predict(movie))
-                for movie in movies
-            ]
-            scored.sort(key=lambda x: x[1], reverse=True)
+            rows = self._candidate_rows(Movie.objects.filter(genres__icontains=genre))
+            rows = rows[unrated[rows]]
             
-            genre_recommendations[genre] = scored[:n_per_genre]
-        
-        return genre_recommendations
+            # Score in one batch and keep the best
+            scores = self._predict_rows(rows)
+            return self._top_movies(rows, scores, n_per_genre)
+        finally:
+            # Worker threads open their own connection; the caller's is left alone
+            if threading.get_ident() != caller:
+                connection.close()
     
     def get_similar_movies(
         self,
@@ -351,33 +616,54 @@ class MovieRecommender:
         """
         Find similar movies using cosine similarity.
         
-        Demonstrates: SciPy distance, NumPy arrays, lambda
+        The catalogue is scored in blocks of SIMILARITY_CHUNK_ROWS rows,
+        keeping only each block's top n, so temporaries stay bounded
+        however large the catalogue grows.
+        
+        Demonstrates: NumPy matrix-vector product, boolean masks, chunking
         """
-        from movies.models import Movie
+        if self._feature_matrix is None:
+            self._build_feature_cache()
+        
+        if not self._pk_to_row:
+            return []
         
         # Get target movie features
         target_features = self._extract_movie_features(movie)
+        target_norm = np.linalg.norm(target_features)
         
-        similarities = []  # list of (movie, similarity)
+        if self._normalized_matrix is None:
+            # Unit-length rows once, so each search is a plain dot product;
+            # all-zero rows stay zero and score 0
+            norms = np.linalg.norm(self._feature_matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._normalized_matrix = self._feature_matrix / norms
         
-        # Compare with all other movies
-        for other_movie in Movie.objects.exclude(pk=movie.pk):
-            other_features = self._extract_movie_features(other_movie)
+        if target_norm > 0:
+            target_unit = target_features / target_norm
+        else:
+            target_unit = np.zeros_like(target_features)
+        
+        best_rows = []  # per-block winners, merged below
+        best_similarities = []
+        
+        for start in range(0, len(self._feature_pks), SIMILARITY_CHUNK_ROWS):
+            block = slice(start, start + SIMILARITY_CHUNK_ROWS)
             
-            # Calculate cosine similarity using SciPy
-            # Note: cosine distance = 1 - cosine similarity
-            try:
-                distance = spatial.distance.cosine(target_features, other_features)
-                similarity = 1 - distance
-            except:
-                similarity = 0.0
+            # Cosine similarity against the block with one matrix-vector
+            # product of unit vectors
+            similarities = self._normalized_matrix[block] @ target_unit
             
-            similarities.append((other_movie, similarity))
-        
-        # Sort by similarity using lambda
-        similarities.sort(key=lambda x: x[1], reverse=True)
+            # Never recommend the movie itself
+            others = np.flatnonzero(self._feature_pks[block] != movie.pk)
+            keep = others[_top_n_indices(similarities[others], n)]
+            
+            best_rows.append(keep + start)
+            best_similarities.append(similarities[keep])
         
-        return similarities[:n]
+        # Blocks are concatenated in row order, so ties still resolve by row
+        rows = np.concatenate(best_rows)
+        return self._top_movies(rows, np.concatenate(best_similarities), n)
 
 
 class RecommendationIterator:
@@ -454,7 +740,7 @@ class RecommendationIterator:
                 'movie': movie,
                 'movie_title': movie.title,
                 'predicted_rating': score,
-                'genres': movie.get_genres_list(),
+                'genres': movie.genres_list,
             }
             for movie, score in self.recommendations
         ]
@@ -472,48 +758,54 @@ class CollaborativeFilter:
         Demonstrates: __init__
         """
         self.n_neighbors = n_neighbors
-        self._user_matrix = None
+        self._user_matrix = None  # scipy.sparse CSR (users, movies)
+        self._rated_matrix = None  # same sparsity, 1.0 where rated
         self._movie_ids = []
         self._user_ids = []
     
     def build_matrix(self) -> None:
         """
-        Build user-movie rating matrix.
+        Build the user-movie rating matrix as SciPy sparse CSR.
+        
+        Memory grows with the number of ratings, not users x movies.
+        A parallel 0/1 matrix marks which cells hold a rating.
         
-        Demonstrates: NumPy matrix, for loops, dict
+        Demonstrates: SciPy sparse matrices, np.unique, vectorized indexing
         """
-        from movies.models import Rating, User, Movie
+        from movies.models import Rating
+        
+        # (user_id, movie_id, stars) triplets; order_by() drops the Meta
+        # ordering, which would otherwise leak into the query
+        triplets = list(Rating.objects.order_by().values_list('user_id', 'movie_id', 'stars'))
         
-        # Get all users and movies
-        self._user_ids = list(
-            Rating.objects.values_list('user_id', flat=True).distinct()
+        if triplets:
+            user_ids, movie_ids, stars = (np.array(column) for column in zip(*triplets))
+        else:
+            user_ids = movie_ids = np.empty(0, dtype=np.int64)
+            stars = np.empty(0, dtype=np.float64)
+        
+        # Sorted distinct ids and each rating's row/column, in one call each
+        users, u_rows = np.unique(user_ids, return_inverse=True)
+        movies, m_cols = np.unique(movie_ids, return_inverse=True)
+        self._user_ids = users.tolist()
+        self._movie_ids = movies.tolist()
+        
+        shape = (len(self._user_ids), len(self._movie_ids))
+        self._user_matrix = sparse.csr_matrix(
+            (stars.astype(np.float64), (u_rows, m_cols)), shape=shape
         )
-        self._movie_ids = list(
-            Rating.objects.values_list('movie_id', flat=True).distinct()
+        self._rated_matrix = sparse.csr_matrix(
+            (np.ones(len(stars)), (u_rows, m_cols)), shape=shape
         )
-        
-        # Create mapping dicts
-        user_idx = {uid: i for i, uid in enumerate(self._user_ids)}
-        movie_idx = {mid: i for i, mid in enumerate(self._movie_ids)}
-        
-        # Initialize matrix with NaN
-        n_users = len(self._user_ids)
-        n_movies = len(self._movie_ids)
-        self._user_matrix = np.full((n_users, n_movies), np.nan)
-        
-        # Fill matrix with ratings
-        for rating in Rating.objects.all():
-            u_idx = user_idx.get(rating.user_id)
-            m_idx = movie_idx.get(rating.movie_id)
-            
-            if u_idx is not None and m_idx is not None:
-                self._user_matrix[u_idx, m_idx] = rating.stars
     
     def find_similar_users(self, user_id: int) -> List[Tuple[int, float]]:
         """
         Find similar users using cosine similarity.
         
-        Demonstrates: NumPy operations, SciPy distance, loops
+        Each similarity is computed over the movies both users rated, for
+        all users at once with masked matrix-vector products.
+        
+        Demonstrates: NumPy masks, matrix-vector products, vectorization
         """
         if self._user_matrix is None:
             self.build_matrix()
@@ -524,43 +816,84 @@ class CollaborativeFilter:
             return []
         
         target_idx = user_idx_map[user_id]
-        target_ratings = self._user_matrix[target_idx]
         
-        similarities = []
+        # Sparse ratings (missing = 0) plus the 0/1 "has rated" matrix, so
+        # that products only count the movies both users rated
+        M = self._user_matrix
+        W = self._rated_matrix
+        t0 = M[target_idx].toarray().ravel()
+        t_mask = W[target_idx].toarray().ravel()
         
-        for other_idx, other_id in enumerate(self._user_ids):
-            if other_id == user_id:
-                continue
-            
-            other_ratings = self._user_matrix[other_idx]
-            
-            # Find common ratings
-            mask = ~np.isnan(target_ratings) & ~np.isnan(other_ratings)
-            
-            if np.sum(mask) < 2:
-                continue
-            
-            # Calculate similarity
-            try:
-                dist = spatial.distance.cosine(
-                    target_ratings[mask],
-                    other_ratings[mask]
-                )
-                sim = 1 - dist
-                similarities.append((other_id, sim))
-            except:
-                continue
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        return similarities[:self.n_neighbors]
+        # Cosine over common ratings for every user at once (sparse GEMV)
+        common = W @ t_mask  # number of movies rated by both
+        dots = M @ t0
+        target_norms = np.sqrt(W @ (t0 ** 2))  # target's norm on common movies
+        other_norms = np.sqrt(M.multiply(M) @ t_mask)  # other's norm on common movies
+        denominators = target_norms * other_norms
+        
+        # Need 2+ common movies; skip the user themself
+        valid = (common >= 2) & (denominators > 0)
+        valid[target_idx] = False
+        candidates = np.flatnonzero(valid)
+        
+        similarities = dots[candidates] / denominators[candidates]
+        best = _top_n_indices(similarities, self.n_neighbors)
+        
+        return [
+            (self._user_ids[candidates[i]], float(similarities[i]))
+            for i in best
+        ]
 
 
 # ==============================================================
 # Utility Functions
 # ==============================================================
 
+def _predict_numpy(X: np.ndarray, w: np.ndarray, b: float) -> np.ndarray:
+    """
+    Linear prediction clipped to the star range, with no sklearn dispatch.
+    
+    Demonstrates: NumPy dot product, np.clip
+    """
+    return np.clip(X @ w + b, 0.5, 5.0)
+
+
+def _parse_genres(genres: Optional[str]) -> List[str]:
+    """
+    Split a genres string like Movie.genres_list does.
+    
+    Demonstrates: String split/strip, filtered list comprehension
+    """
+    if not genres:
+        return []
+    return [g.strip().title() for g in genres.split(',') if g.strip()]
+
+
+def _top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """
+    Indices of the n highest scores, best first.
+    
+    O(N) argpartition plus an O(n log n) sort of the winners, instead
+    of sorting every score; ties keep their original order, exactly
+    like a stable sort followed by [:n].
+    
+    Demonstrates: np.argpartition, boolean masks, stable argsort
+    """
+    if n <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    if n < scores.size:
+        # n-th highest score; everything at or above it is a candidate,
+        # so ties at the cut-off are decided by position, not by chance
+        threshold = scores[np.argpartition(-scores, n - 1)[n - 1]]
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(scores.size)
+    
+    order = np.argsort(-scores[candidates], kind='stable')
+    return candidates[order[:n]]
+
+
 def calculate_rmse(actual: List[float], predicted: List[float]) -> float:
     """
     Calculate Root Mean Square Error.
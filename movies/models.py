@@ -15,10 +15,57 @@ Demonstrates:
 - Casting (int, float, str)
 """
 
+from collections import defaultdict
+from functools import cached_property
+from itertools import islice
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
-from typing import List, Set
+from typing import FrozenSet, Iterable, List, Set, Tuple
+
+
+# Movies per batch when rebuilding genre links
+GENRE_SYNC_BATCH_SIZE = 2000
+
+# Title -> Letterboxd slug characters, applied in a single translate() pass
+_SLUG_TABLE = str.maketrans({' ': '-', "'": '', ':': ''})
+
+
+def _format_hm(minutes: int) -> str:
+    """
+    Format a duration in minutes as "2h 5m" (or "45m" under an hour).
+    
+    Demonstrates: divmod, tuple unpacking, f-strings
+    """
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+def _star_display(stars: float) -> str:
+    """
+    Visual star display such as "★★★½☆" for a rating out of 5.
+    
+    Demonstrates: Casting (float to int), string multiplication,
+                 if/else, f-strings
+    """
+    full_stars = int(stars)  # Casting: float to int
+    half_star = (stars - full_stars) >= 0.5
+    
+    display = '★' * full_stars  # String multiplication
+    if half_star:
+        display += '½'
+    
+    # Pad with empty stars to show rating out of 5
+    remaining = 5 - full_stars - (1 if half_star else 0)
+    display += '☆' * remaining
+    
+    return display
+
+
+# Every display for 0-5 stars in half steps, indexed by int(stars * 2)
+_STAR_DISPLAY = tuple(_star_display(i / 2) for i in range(11))
 
 
 class TimestampedModel(models.Model):
@@ -107,6 +154,108 @@ class UserProfile(TimestampedModel):
         return Rating.objects.filter(user=self.user).count()
 
 
+class Genre(models.Model):
+    """
+    A genre name, linked to movies through Movie.genres_m2m.
+    
+    Movie.genres stays the source of truth; the links are derived from
+    it (see sync_movies) so genre overlap can be computed in SQL.
+    
+    Demonstrates: Django ORM many-to-many, classmethods, bulk operations
+    """
+    name = models.CharField(max_length=100, unique=True)
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self) -> str:
+        return self.name
+    
+    @staticmethod
+    def parse_names(genres: str) -> List[str]:
+        """
+        Distinct genre names in a genres string, normalized like
+        Movie.genres_list.
+        
+        Demonstrates: String modification, dict.fromkeys for ordered dedup
+        """
+        if not genres:
+            return []
+        return list(dict.fromkeys(
+            g.strip().title()[:100] for g in genres.split(',') if g.strip()
+        ))
+    
+    @classmethod
+    def sync_movies(cls, movies: Iterable[Tuple[int, str]]) -> int:
+        """
+        Rebuild the genre links of (movie_id, genres string) pairs.
+        
+        Works in batches: missing Genre rows are created, each batch's
+        old links are deleted and the new ones bulk-inserted in one
+        transaction. Returns the number of links written.
+        
+        Demonstrates: Bulk operations, set operations, dict caching
+        """
+        from django.db import transaction
+        
+        links_model = Movie.genres_m2m.through
+        genre_ids = {}  # dict: name -> Genre id, shared across batches
+        written = 0
+        
+        movies = iter(movies)
+        while True:
+            batch = [
+                (movie_id, cls.parse_names(genres))
+                for movie_id, genres in islice(movies, GENRE_SYNC_BATCH_SIZE)
+            ]
+            if not batch:
+                return written
+            
+            new_names = {name for _, names in batch for name in names} - genre_ids.keys()
+            if new_names:
+                cls.objects.bulk_create([cls(name=name) for name in new_names], ignore_conflicts=True)
+                genre_ids.update(cls.objects.filter(name__in=new_names).values_list('name', 'id'))
+            
+            links = [
+                links_model(movie_id=movie_id, genre_id=genre_ids[name])
+                for movie_id, names in batch
+                for name in names
+            ]
+            with transaction.atomic():
+                links_model.objects.filter(movie_id__in=[movie_id for movie_id, _ in batch]).delete()
+                links_model.objects.bulk_create(links)
+            written += len(links)
+    
+    @classmethod
+    def sync_unlinked(cls) -> int:
+        """
+        Link movies that have a genres string but no genre links yet.
+        
+        bulk_create and the import's COPY path skip signals, so bulk
+        writers call this afterwards. Pages through the movies by pk
+        (keyset pagination), so rows are never re-read while links are
+        written. Returns the number of links written.
+        
+        Demonstrates: Keyset pagination, while loops
+        """
+        unlinked = (
+            Movie.objects
+            .filter(genres_m2m__isnull=True)
+            .exclude(genres='')
+            .order_by('pk')
+            .values_list('pk', 'genres')
+        )
+        
+        written = 0
+        last_pk = 0
+        while True:
+            page = list(unlinked.filter(pk__gt=last_pk)[:GENRE_SYNC_BATCH_SIZE])
+            if not page:
+                return written
+            written += cls.sync_movies(page)
+            last_pk = page[-1][0]
+
+
 class Movie(TimestampedModel):
     """
     Movie model with full IMDB data capabilities.
@@ -120,6 +269,7 @@ class Movie(TimestampedModel):
         validators=[MinValueValidator(1888), MaxValueValidator(2100)]
     )
     genres = models.CharField(max_length=500, default='')
+    genres_m2m = models.ManyToManyField(Genre, related_name='movies', blank=True)  # Derived from genres
     overview = models.TextField(blank=True, default='')  # Plot
     poster_path = models.CharField(max_length=500, blank=True, default='')
     runtime = models.IntegerField(null=True, blank=True)  # in minutes
@@ -153,6 +303,10 @@ class Movie(TimestampedModel):
     # Internal
     popularity = models.FloatField(default=0.0)
     
+    # Rating stats, kept in step with Rating by signals (see movies/signals.py)
+    avg_rating_cached = models.FloatField(default=0.0, db_index=True)
+    rating_count_cached = models.IntegerField(default=0)
+    
     class Meta:
         ordering = ['-popularity', '-imdb_rating', 'title']
         indexes = [
@@ -161,6 +315,7 @@ class Movie(TimestampedModel):
             models.Index(fields=['tmdb_id']),
             models.Index(fields=['imdb_id']),
             models.Index(fields=['imdb_rating']),
+            models.Index(fields=['popularity']),
         ]
     
     def __str__(self) -> str:
@@ -174,11 +329,12 @@ class Movie(TimestampedModel):
             return f"{self.title} ({self.year}) ★ {avg_rating:.1f}"
         return f"{self.title} ({self.year})"
     
-    def get_genres_list(self) -> List[str]:
+    @cached_property
+    def genres_list(self) -> List[str]:
         """
-        Parse genres string into list.
+        Parse genres string into list (parsed once per instance).
         
-        Demonstrates: String modification, list comprehension, 
+        Demonstrates: cached_property, string modification, list comprehension,
                      conditional logic in comprehension
         """
         if not self.genres:
@@ -186,13 +342,22 @@ class Movie(TimestampedModel):
         # String split and strip, filtering empty strings
         return [g.strip().title() for g in self.genres.split(',') if g.strip()]
     
-    def get_genres_set(self) -> Set[str]:
+    @cached_property
+    def genres_set(self) -> FrozenSet[str]:
         """
         Get genres as a set for efficient lookups.
         
-        Demonstrates: Casting list to set
+        Demonstrates: cached_property, casting list to frozenset
         """
-        return set(self.get_genres_list())
+        return frozenset(self.genres_list)
+    
+    def get_genres_list(self) -> List[str]:
+        """Cached genres list (shared; copy before mutating)."""
+        return self.genres_list
+    
+    def get_genres_set(self) -> FrozenSet[str]:
+        """Cached genres set."""
+        return self.genres_set
     
     def set_genres(self, genre_list: List[str]) -> None:
         """
@@ -203,6 +368,17 @@ class Movie(TimestampedModel):
         # Normalize: strip and title case each genre
         normalized = [g.strip().title() for g in genre_list]
         self.genres = ', '.join(normalized)
+        self._clear_genre_cache()
+    
+    def _clear_genre_cache(self) -> None:
+        """Drop the cached_property values derived from self.genres."""
+        for name in ('genres_list', 'genres_set', '_genres_lower'):
+            self.__dict__.pop(name, None)
+    
+    @cached_property
+    def _genres_lower(self) -> FrozenSet[str]:
+        """Lowercased genres for case-insensitive membership tests."""
+        return frozenset(g.lower() for g in self.genres_list)
     
     def has_genre(self, genre: str) -> bool:
         """
@@ -210,27 +386,46 @@ class Movie(TimestampedModel):
         
         Demonstrates: String modification (lower), set membership
         """
-        genre_set = {g.lower() for g in self.get_genres_list()}
-        return genre.lower().strip() in genre_set
+        return genre.strip().lower() in self._genres_lower
     
     @property
     def average_rating(self) -> float:
         """
-        Calculate average rating for this movie.
+        Average rating for this movie (stored column, no query).
         
-        Demonstrates: Django ORM aggregation, property, casting
+        Demonstrates: Property, denormalized field
         """
-        from django.db.models import Avg
-        result = self.ratings.aggregate(avg=Avg('stars'))
-        avg = result.get('avg')
-        return float(avg) if avg else 0.0  # Casting: Decimal/None to float
+        return self.avg_rating_cached
     
     @property
     def rating_count(self) -> int:
         """
-        Demonstrates: Property, ORM count
+        Number of ratings for this movie (stored column, no query).
+        
+        Demonstrates: Property, denormalized field
+        """
+        return self.rating_count_cached
+    
+    @classmethod
+    def refresh_rating_stats(cls, movie_ids: Iterable[int]) -> int:
+        """
+        Recompute avg_rating_cached / rating_count_cached from the ratings
+        table for the given movies, in one UPDATE. Returns rows updated.
+        
+        Demonstrates: Class method, ORM subqueries
         """
-        return self.ratings.count()
+        from django.db.models import Avg, Count, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        
+        per_movie = Rating.objects.filter(movie=OuterRef('pk')).order_by().values('movie')
+        return cls.objects.filter(pk__in=list(movie_ids)).update(
+            avg_rating_cached=Coalesce(
+                Subquery(per_movie.annotate(avg=Avg('stars')).values('avg')), Value(0.0)
+            ),
+            rating_count_cached=Coalesce(
+                Subquery(per_movie.annotate(n=Count('pk')).values('n')), Value(0)
+            ),
+        )
     
     @property
     def imdb_url(self) -> str:
@@ -242,90 +437,116 @@ class Movie(TimestampedModel):
     @property
     def letterboxd_url(self) -> str:
         """Get the Letterboxd URL for this movie."""
-        slug = self.title.lower().replace(' ', '-').replace("'", "").replace(":", "")
+        slug = self.title.lower().translate(_SLUG_TABLE)
         return f"https://letterboxd.com/film/{slug}-{self.year}/"
     
-    def get_directors_list(self) -> List[str]:
-        """Parse directors string into list."""
+    @cached_property
+    def directors_list(self) -> List[str]:
+        """Parse directors string into list (parsed once per instance)."""
         if not self.director:
             return []
         return [d.strip() for d in self.director.split(',') if d.strip()]
     
-    def get_actors_list(self) -> List[str]:
-        """Parse actors string into list."""
+    def get_directors_list(self) -> List[str]:
+        """Cached directors list (shared; copy before mutating)."""
+        return self.directors_list
+    
+    @cached_property
+    def actors_list(self) -> List[str]:
+        """Parse actors string into list (parsed once per instance)."""
         if not self.actors:
             return []
         return [a.strip() for a in self.actors.split(',') if a.strip()]
     
-    def get_countries_list(self) -> List[str]:
-        """Parse countries string into list."""
+    def get_actors_list(self) -> List[str]:
+        """Cached actors list (shared; copy before mutating)."""
+        return self.actors_list
+    
+    @cached_property
+    def countries_list(self) -> List[str]:
+        """Parse countries string into list (parsed once per instance)."""
         if not self.country:
             return []
         return [c.strip() for c in self.country.split(',') if c.strip()]
     
-    def get_languages_list(self) -> List[str]:
-        """Parse languages string into list."""
+    def get_countries_list(self) -> List[str]:
+        """Cached countries list (shared; copy before mutating)."""
+        return self.countries_list
+    
+    @cached_property
+    def languages_list(self) -> List[str]:
+        """Parse languages string into list (parsed once per instance)."""
         if not self.language:
             return []
         return [l.strip() for l in self.language.split(',') if l.strip()]
     
+    def get_languages_list(self) -> List[str]:
+        """Cached languages list (shared; copy before mutating)."""
+        return self.languages_list
+    
     def get_display_runtime(self) -> str:
         """
         Format runtime as hours and minutes.
         
-        Demonstrates: Integer division, modulo, f-strings, if/else
+        Demonstrates: if/else, shared helper function
         """
         if not self.runtime:
             return "Runtime unknown"
-        
-        hours = self.runtime // 60  # Integer division
-        minutes = self.runtime % 60  # Modulo
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
+        return _format_hm(self.runtime)
     
     def get_similar_by_genre(self, limit: int = 5):
         """
         Find similar movies by genre overlap.
         
-        Demonstrates: For loop, if/else, collections (set, dict),
-                     lambda for sorting, Django ORM
-        """
-        my_genres = self.get_genres_set()
-        if not my_genres:
-            return Movie.objects.none()
-        
-        # Get all other movies
-        candidates = Movie.objects.exclude(pk=self.pk)
-        
-        # Calculate genre overlap scores using dict
-        scores = {}  # dict: movie_id -> overlap_count
-        
-        for movie in candidates:
-            other_genres = movie.get_genres_set()
-            # Set intersection to find common genres
-            overlap = my_genres & other_genres  # Set intersection
-            if overlap:
-                scores[movie.pk] = len(overlap)
-        
-        # Sort by overlap score using lambda
-        sorted_ids = sorted(
-            scores.keys(),
-            key=lambda pk: scores[pk],  # Lambda function
-            reverse=True
-        )[:limit]
+        One query: the other movies sharing a genre with this one are
+        annotated with the number of shared genres, sorted by it (ties
+        in the default movie ordering) and limited in SQL.
         
-        # Return movies in sorted order
-        if not sorted_ids:
-            return Movie.objects.none()
+        Demonstrates: Django ORM many-to-many joins, aggregation, subqueries
+        """
+        from django.db.models import Count
         
-        # Preserve order using Case/When
-        from django.db.models import Case, When
-        preserved = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(sorted_ids)])
-        return Movie.objects.filter(pk__in=sorted_ids).order_by(preserved)
+        return (
+            Movie.objects
+            .exclude(pk=self.pk)
+            .filter(genres_m2m__in=self.genres_m2m.all())
+            .annotate(overlap=Count('genres_m2m'))
+            .order_by('-overlap', *Movie._meta.ordering)[:limit]
+        )
     
+    @classmethod
+    def search_by_title(cls, query: str, limit: int = 10) -> List['Movie']:
+        """
+        Search movies by title.
+
+        On SQLite this uses the movie_fts full-text index (every word of
+        the query as a prefix, best matches first). Falls back to a
+        case-insensitive substring match when FTS is unavailable or finds
+        nothing. The index is only as fresh as its triggers; see movies.fts
+        for how they are guarded and how to rebuild it.
+
+        Demonstrates: Classmethods, string modification, raw SQL
+        """
+        from django.db import DatabaseError, connection
+
+        # Quote each word so FTS5 operators in user input are literal
+        terms = ' '.join('"' + word.replace('"', '""') + '"*' for word in query.split())
+
+        if terms and connection.vendor == 'sqlite':
+            sql = (
+                f"SELECT m.* FROM {cls._meta.db_table} m "
+                "JOIN movie_fts ON movie_fts.rowid = m.id "
+                "WHERE movie_fts MATCH %s ORDER BY bm25(movie_fts) LIMIT %s"
+            )
+            try:
+                movies = list(cls.objects.raw(sql, [terms, limit]))
+            except DatabaseError:
+                movies = []  # movie_fts not created (FTS5 not compiled in)
+            if movies:
+                return movies
+
+        return list(cls.objects.filter(title__icontains=query)[:limit])
+
     @classmethod
     def from_tmdb_json(cls, data: dict) -> 'Movie':
         """
@@ -380,24 +601,29 @@ class Rating(TimestampedModel):
         # f-string with .1f format for rating precision
         return f"{self.user.username} rated '{self.movie.title}': {self.stars:.1f}★"
     
-    def get_tags_list(self) -> List[str]:
+    @cached_property
+    def tags_list(self) -> List[str]:
         """
-        Parse tags string into list.
+        Parse tags string into list (parsed once per instance).
         
-        Demonstrates: String modification, list comprehension
+        Demonstrates: cached_property, string modification, list comprehension
         """
         if not self.tags:
             return []
         # Split, strip, and lowercase for consistency
         return [tag.strip().lower() for tag in self.tags.split(',') if tag.strip()]
     
+    def get_tags_list(self) -> List[str]:
+        """Cached tags list (shared; copy before mutating)."""
+        return self.tags_list
+    
     def get_tags_set(self) -> Set[str]:
         """
-        Get tags as a set.
+        Get tags as a set (a fresh set; callers may modify it).
         
         Demonstrates: Set creation from list
         """
-        return set(self.get_tags_list())
+        return set(self.tags_list)
     
     def set_tags(self, tag_list: List[str]) -> None:
         """
@@ -407,6 +633,7 @@ class Rating(TimestampedModel):
         """
         normalized = [tag.strip().lower() for tag in tag_list if tag.strip()]
         self.tags = ', '.join(normalized)
+        self.__dict__.pop('tags_list', None)
     
     def add_tag(self, tag: str) -> None:
         """
@@ -422,27 +649,19 @@ class Rating(TimestampedModel):
         if tag not in current_tags:
             current_tags.add(tag)  # Set add operation
             self.tags = ', '.join(sorted(current_tags))
+            self.__dict__.pop('tags_list', None)
             self.save()
     
     def get_star_display(self) -> str:
         """
         Get visual star display.
         
-        Demonstrates: Casting (float to int), string multiplication,
-                     if/else, f-strings
+        Demonstrates: Tuple lookup table, casting (float to int)
         """
-        full_stars = int(self.stars)  # Casting: float to int
-        half_star = (self.stars - full_stars) >= 0.5
-        
-        display = '★' * full_stars  # String multiplication
-        if half_star:
-            display += '½'
-        
-        # Pad with empty stars to show rating out of 5
-        remaining = 5 - full_stars - (1 if half_star else 0)
-        display += '☆' * remaining
-        
-        return display
+        index = int(self.stars * 2)
+        if 0 <= index < len(_STAR_DISPLAY):
+            return _STAR_DISPLAY[index]
+        return _star_display(self.stars)  # Out of the validated range
 
 
 class WatchEvent(TimestampedModel):
@@ -481,17 +700,11 @@ class WatchEvent(TimestampedModel):
     
     def get_watch_time_display(self) -> str:
         """
-        Demonstrates: Integer division, modulo, f-strings
+        Demonstrates: if/else, shared helper function
         """
         if not self.watch_duration:
             return "Unknown"
-        
-        hours = self.watch_duration // 60
-        minutes = self.watch_duration % 60
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        return f"{minutes}m"
+        return _format_hm(self.watch_duration)
 
 
 # ==============================================================
@@ -506,30 +719,35 @@ class MovieIterator:
                  classes, __init__, methods with self
     """
     
-    def __init__(self, queryset, batch_size: int = 10):
+    def __init__(self, queryset, batch_size: int = 2000):
         """
+        Movies are streamed from the database batch_size rows at a time
+        rather than loaded into a list up front.
+        
         Demonstrates: __init__ method, self, type hints
         """
         self.queryset = queryset
         self.batch_size = batch_size
         self.index = 0
-        self._cache = list(queryset)  # Casting queryset to list
+        self._iter = None  # Active queryset.iterator(), started by __iter__
+        self._count = None  # Cached __len__
     
     def __iter__(self):
         """
         Demonstrates: Iterator protocol - returns self
         """
         self.index = 0
+        self._iter = self.queryset.iterator(chunk_size=self.batch_size)
         return self
     
     def __next__(self) -> Movie:
         """
-        Demonstrates: __next__ for iterator, if/else, StopIteration
+        Demonstrates: __next__ for iterator, StopIteration
         """
-        if self.index >= len(self._cache):
-            raise StopIteration
+        if self._iter is None:
+            iter(self)
         
-        movie = self._cache[self.index]
+        movie = next(self._iter)  # Raises StopIteration when exhausted
         self.index += 1
         return movie
     
@@ -537,20 +755,20 @@ class MovieIterator:
         """
         Demonstrates: __len__ dunder method
         """
-        return len(self._cache)
+        if self._count is None:
+            self._count = self.queryset.count()
+        return self._count
     
     def get_by_genre(self, genre: str):
         """
         Filter iterator by genre.
         
-        Demonstrates: For loop, if/else, lambda, filter
+        Genre names are stored normalized like genres_list, so this is an
+        exact lookup on the unique Genre.name index plus the link join.
+        
+        Demonstrates: String normalization, ORM join filtering
         """
-        # Using filter with lambda
-        filtered = filter(
-            lambda m: m.has_genre(genre),  # Lambda function
-            self._cache
-        )
-        return list(filtered)
+        return list(self.queryset.filter(genres_m2m__name=genre.strip().title()))
 
 
 class RatingStatistics:
@@ -563,32 +781,32 @@ class RatingStatistics:
     
     def __init__(self, ratings_queryset):
         """
+        ratings_queryset must be a Rating QuerySet; its movies are joined
+        in the same query so the per-genre loops issue no extra SELECTs.
+        
         Demonstrates: __init__, self, queryset to list casting
         """
-        self.ratings = list(ratings_queryset)
+        self.ratings = list(ratings_queryset.select_related('movie'))
         self._stats_cache = {}  # dict for caching
     
     def get_stats_by_genre(self) -> dict:
         """
         Group ratings by movie genre.
         
-        Demonstrates: Collections (dict), for loops, 
-                     nested loops, if/else, list append
+        Demonstrates: Collections (defaultdict), for loops, 
+                     nested loops, list append
         """
-        genre_ratings = {}  # dict: genre -> list of ratings
+        genre_ratings = defaultdict(list)  # dict: genre -> list of ratings
         
         # For loop over ratings
         for rating in self.ratings:
-            # Get genres for this movie
-            genres = rating.movie.get_genres_list()
+            stars = rating.stars
             
-            # Nested loop over genres
-            for genre in genres:
-                if genre not in genre_ratings:
-                    genre_ratings[genre] = []  # Initialize list
-                genre_ratings[genre].append(rating.stars)
+            # Nested loop over this movie's genres
+            for genre in rating.movie.genres_list:
+                genre_ratings[genre].append(stars)
         
-        return genre_ratings
+        return dict(genre_ratings)
     
     def get_user_genre_preferences(self) -> dict:
         """
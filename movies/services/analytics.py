@@ -18,7 +18,6 @@ from typing import Dict, List, Tuple, Optional, Any
 from collections import defaultdict
 from datetime import datetime, timedelta
 from django.utils import timezone
-from django.db.models import Count
 
 
 class AnalyticsService:
@@ -57,7 +56,7 @@ class AnalyticsService:
         
         # For loop to aggregate ratings by genre
         for rating in ratings:
-            genres = rating.movie.get_genres_list()  # list of genres
+            genres = rating.movie.genres_list  # list of genres
             
             # Nested for loop over genres
             for genre in genres:
@@ -243,7 +242,7 @@ class AnalyticsService:
             hour_counts[hour] += 1
             
             # Genre counts
-            for genre in event.movie.get_genres_list():
+            for genre in event.movie.genres_list:
                 genre_watch_counts[genre] += 1
         
         # Day names mapping
@@ -272,9 +271,7 @@ class AnalyticsService:
         from movies.models import Rating, Movie
         
         # Get movies with ratings
-        movies = Movie.objects.annotate(
-            num_ratings=Count('ratings')
-        ).filter(rating_count__gt=0)
+        movies = Movie.objects.filter(rating_count_cached__gt=0)
         
         if movies.count() < 3:
             return {'message': 'Not enough data for correlation analysis'}
@@ -6,6 +6,8 @@ External API Integrations for CineSense
 
 import requests
 import re
+import threading
+import time
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from functools import lru_cache
@@ -80,6 +82,30 @@ class LetterboxdMovieData:
         return "N/A"
 
 
+class RateLimiter:
+    """
+    Spaces out calls across threads so at most one starts every `interval` seconds.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def wait(self):
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class OMDBRequestError(Exception):
+    """An OMDB lookup that failed (network error, quota, bad key) rather than a miss."""
+
+
 class OMDBApiClient:
     """
     Client for OMDB API (Open Movie Database)
@@ -88,34 +114,69 @@ class OMDBApiClient:
     
     BASE_URL = "http://www.omdbapi.com/"
     CACHE_TIMEOUT = 86400  # 24 hours
+    # Error texts of a 'Response: False' reply meaning the movie does not exist
+    NOT_FOUND_ERRORS = frozenset({'Movie not found!', 'Incorrect IMDb ID.'})
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, throttle=None):
         self.api_key = api_key or getattr(settings, 'OMDB_API_KEY', None)
+        self.throttle = throttle  # Optional callable run before each HTTP request
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session, one per thread (Session is not thread-safe)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+        
+    def _make_request(self, params: Dict[str, Any], raise_errors: bool = False) -> Optional[Dict]:
+        """
+        Make a request to OMDB API.
         
-    def _make_request(self, params: Dict[str, Any]) -> Optional[Dict]:
-        """Make a request to OMDB API"""
+        Returns None when OMDB has no such movie. Other failures also return
+        None, unless raise_errors is set, in which case they raise
+        OMDBRequestError so callers can tell them apart from a real miss.
+        """
         if not self.api_key:
             logger.warning("OMDB API key not configured")
             return None
             
         params['apikey'] = self.api_key
         
+        if self.throttle:
+            self.throttle()
+        
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
             if data.get('Response') == 'False':
-                logger.warning(f"OMDB API error: {data.get('Error')}")
+                error = data.get('Error')
+                logger.warning(f"OMDB API error: {error}")
+                if raise_errors and error not in self.NOT_FOUND_ERRORS:
+                    raise OMDBRequestError(error)
                 return None
                 
             return data
         except requests.RequestException as e:
             logger.error(f"OMDB API request failed: {e}")
+            if raise_errors:
+                raise OMDBRequestError(str(e)) from e
             return None
     
-    def search_by_title(self, title: str, year: Optional[int] = None) -> Optional[IMDBMovieData]:
-        """Search for a movie by title and optionally year"""
+    def search_by_title(
+        self, title: str, year: Optional[int] = None, year_fallback: bool = False,
+        raise_errors: bool = False,
+    ) -> Optional[IMDBMovieData]:
+        """
+        Search for a movie by title and optionally year.
+        
+        With year_fallback=True, a miss on title+year is retried by title
+        alone over the same keep-alive connection. With raise_errors=True,
+        failures other than "not found" raise OMDBRequestError.
+        """
         cache_key = f"omdb_title_{title}_{year}"
         cached = cache.get(cache_key)
         if cached:
@@ -125,8 +186,10 @@ class OMDBApiClient:
         if year:
             params['y'] = year
             
-        data = self._make_request(params)
+        data = self._make_request(params, raise_errors)
         if not data:
+            if year and year_fallback:
+                return self.search_by_title(title, raise_errors=raise_errors)
             return None
             
         result = self._parse_movie_data(data)
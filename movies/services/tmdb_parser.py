@@ -44,6 +44,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Placeholder strings that mean "no value" in the CSV
+_EMPTY_VALUES = frozenset({'nan', 'None', '[]'})
+
+
+def normalize_genre_names(names) -> str:
+    """
+    Join genre names into a comma-separated string.
+    
+    Strips whitespace, drops empty and placeholder entries, and removes
+    duplicates while keeping the original order, in a single pass.
+    """
+    return ', '.join(dict.fromkeys(
+        name for name in map(str.strip, names)
+        if name and name not in _EMPTY_VALUES
+    ))
+
 
 class TMDBParser:
     """
@@ -88,6 +104,9 @@ class TMDBParser:
         """
         self.file_path = file_path
         self.is_gzipped = file_path.endswith('.gz')
+        # Movies dropped by stream_movies' filters
+        self.skipped_adult = 0
+        self.skipped_unpopular = 0
         
     def _open_file(self):
         """Open file with appropriate handler (gzip or plain)."""
@@ -95,23 +114,96 @@ class TMDBParser:
             return gzip.open(self.file_path, 'rt', encoding='utf-8')
         return open(self.file_path, 'r', encoding='utf-8')
     
-    def stream_movies(self) -> Iterator[Dict[str, Any]]:
+    def stream_movies(self, skip_adult: bool = False,
+                      min_popularity: float = 0.0) -> Iterator[Dict[str, Any]]:
         """
         Stream movies one at a time from the dataset.
         
         Memory efficient - only holds one movie in memory at a time.
+        Filtered movies are counted in self.skipped_adult and
+        self.skipped_unpopular.
+        
+        Args:
+            skip_adult: Drop adult movies
+            min_popularity: Drop movies below this popularity
         
         Yields:
-            Dict containing movie data from TMDB
+            Dict containing movie data from TMDB ('popularity' as a float)
+        """
+        if self._first_char() != '[':
+            # JSONL (the TMDB export format): parse line by line directly
+            movies = self._stream_jsonl(skip_adult)
+        else:
+            try:
+                # Try ijson for true streaming (best for large files)
+                import ijson
+                movies = self._stream_with_ijson()
+            except ImportError:
+                # Fallback to line-by-line parsing
+                logger.warning("ijson not installed, using fallback parser (slower for large files)")
+                movies = self._stream_fallback()
+        
+        # Filter while each dict is fresh, so callers get only wanted movies
+        for movie in movies:
+            if skip_adult and movie.get('adult'):
+                self.skipped_adult += 1
+                continue
+            
+            try:
+                popularity = float(movie.get('popularity') or 0.0)
+            except (ValueError, TypeError):
+                popularity = 0.0
+            if popularity < min_popularity:
+                self.skipped_unpopular += 1
+                continue
+            
+            movie['popularity'] = popularity  # Coerced once, reused downstream
+            yield movie
+    
+    def _first_char(self) -> str:
+        """
+        First non-whitespace character of the file ('[' for a JSON array).
+        
+        Reads small chunks rather than lines: a minified JSON array is one
+        line, and reading it whole would load the entire file.
+        """
+        with self._open_file() as f:
+            while chunk := f.read(4096):
+                stripped = chunk.lstrip()
+                if stripped:
+                    return stripped[0]
+        return ''
+    
+    def _stream_jsonl(self, skip_adult: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a JSONL file using orjson when installed (json otherwise).
+        
+        Lines are read as bytes; with skip_adult, lines flagged adult are
+        rejected by a substring check before being parsed at all.
         """
         try:
-            # Try ijson for true streaming (best for large files)
-            import ijson
-            yield from self._stream_with_ijson()
+            import orjson
+            loads = orjson.loads
         except ImportError:
-            # Fallback to line-by-line parsing
-            logger.warning("ijson not installed, using fallback parser (slower for large files)")
-            yield from self._stream_fallback()
+            loads = json.loads
+        
+        opener = gzip.open if self.is_gzipped else open
+        adult_marker = b'"adult":true'
+        
+        with opener(self.file_path, 'rb') as f:
+            for line in f:
+                if skip_adult and adult_marker in line:
+                    self.skipped_adult += 1
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    movie = loads(line)
+                except ValueError:  # Both JSONDecodeErrors subclass ValueError
+                    continue
+                if self._is_valid_movie(movie):
+                    yield movie
     
     def _stream_with_ijson(self) -> Iterator[Dict[str, Any]]:
         """
@@ -288,12 +380,13 @@ class TMDBParser:
             # TMDB poster paths need base URL prepended
             poster_path = f"https://image.tmdb.org/t/p/w500{poster_path}"
         
-        # Get popularity (TMDB provides this)
-        popularity = movie_data.get('popularity', 0.0)
-        try:
-            popularity = float(popularity)
-        except (ValueError, TypeError):
-            popularity = 0.0
+        # Get popularity (TMDB provides this; already a float from stream_movies)
+        popularity = movie_data.get('popularity')
+        if not isinstance(popularity, float):
+            try:
+                popularity = float(popularity or 0.0)
+            except (ValueError, TypeError):
+                popularity = 0.0
         
         # Get overview
         overview = movie_data.get('overview', '') or ''
@@ -375,6 +468,15 @@ class KaggleTMDBParser:
         'keywords': 'keywords',
     }
     
+    # Columns actually read by _row_to_movie; the rest are never parsed
+    USED_COLUMNS = frozenset({
+        'id', 'title', 'original_title', 'status', 'vote_count',
+        'release_date', 'overview', 'runtime', 'popularity', 'poster_path',
+        'imdb_id', 'imdb_rating', 'imdb_vote_count', 'genres', 'cast',
+        'crew', 'production_companies', 'production_countries',
+        'spoken_languages', 'revenue',
+    })
+    
     def __init__(self, file_path: str, chunk_size: int = 10000):
         """
         Initialize parser.
@@ -385,6 +487,7 @@ class KaggleTMDBParser:
         """
         self.file_path = file_path
         self.chunk_size = chunk_size
+        self.skipped_duplicates = 0  # Repeated ids dropped within a pandas chunk
         
     def _parse_json_field(self, value: str) -> Any:
         """
@@ -407,6 +510,11 @@ class KaggleTMDBParser:
     
     def _extract_genres(self, genres_str: str) -> str:
         """Extract genre names from genres JSON string."""
+        if not genres_str or genres_str[0] not in '[{':
+            # Plain "Action, Drama" string: split it directly rather than
+            # paying for a failed json.loads and ast.literal_eval per row
+            return normalize_genre_names(genres_str.split(','))
+        
         parsed = self._parse_json_field(genres_str)
         if not parsed:
             return ''
@@ -418,7 +526,7 @@ class KaggleTMDBParser:
                     genre_names.append(item['name'])
                 elif isinstance(item, str):
                     genre_names.append(item)
-            return ', '.join(genre_names)
+            return normalize_genre_names(genre_names)
         return ''
     
     def _extract_cast(self, cast_str: str, limit: int = 10) -> str:
@@ -569,21 +677,62 @@ class KaggleTMDBParser:
         """Stream using pandas for efficient CSV parsing."""
         import pandas as pd
         
-        # Read in chunks to handle large files
+        # Read in chunks to handle large files, skipping unused columns
         for chunk in pd.read_csv(
             self.file_path,
             chunksize=self.chunk_size,
+            usecols=lambda column: column in self.USED_COLUMNS,
             low_memory=False,
             na_values=['', 'nan', 'None', 'NaN'],
             keep_default_na=True,
             encoding='utf-8',
             on_bad_lines='skip'  # Skip malformed rows
         ):
-            for _, row in chunk.iterrows():
+            # Vectorized pre-filters drop rejected rows before any per-row
+            # Python work; _row_to_movie still applies the same checks
+            if only_released and 'status' in chunk:
+                chunk = chunk[chunk['status'].astype(str).str.lower() == 'released']
+            if min_votes > 0 and 'vote_count' in chunk:
+                votes = pd.to_numeric(chunk['vote_count'], errors='coerce')
+                chunk = chunk[votes.fillna(0) >= min_votes]
+            chunk = self._drop_duplicate_ids(chunk)
+            
+            # Plain dicts per chunk (iterrows builds a Series per row)
+            for row in chunk.to_dict('records'):
                 movie = self._row_to_movie(row, only_released, min_votes)
                 if movie:
                     yield movie
     
+    def _drop_duplicate_ids(self, chunk):
+        """
+        Drop repeated TMDB ids within a chunk, keeping the first valid row.
+        
+        Only rows that _row_to_movie would accept (id, title and year
+        present) take part, so an invalid first copy never hides a valid
+        later one. Ids repeated across chunks are left to the caller.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        if 'id' not in chunk or chunk.empty:
+            return chunk
+        
+        ids = np.trunc(pd.to_numeric(chunk['id'], errors='coerce'))
+        valid = ids.notna() & (ids != 0)
+        titles = chunk['title'].notna() if 'title' in chunk else False
+        if 'original_title' in chunk:
+            titles = titles | chunk['original_title'].notna()
+        valid &= titles
+        if 'release_date' in chunk:
+            years = pd.to_numeric(chunk['release_date'].astype(str).str[:4], errors='coerce')
+            valid &= years.between(1888, 2100)
+        
+        duplicated = ids[valid].duplicated()
+        if not duplicated.any():
+            return chunk
+        self.skipped_duplicates += int(duplicated.sum())
+        return chunk.drop(duplicated.index[duplicated])
+    
     def _stream_with_csv(self, only_released: bool, min_votes: int) -> Iterator[Dict[str, Any]]:
         """Stream using standard csv module (fallback)."""
         with open(self.file_path, 'r', encoding='utf-8', errors='replace') as f:
@@ -0,0 +1,31 @@
+"""
+Signal handlers for the movies app (connected in MoviesConfig.ready).
+"""
+
+from django.db import connections
+
+from movies import fts
+from movies.models import Genre, Movie
+
+
+def sync_movie_genres(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep a saved movie's genre links in step with its genres string."""
+    if raw:
+        return  # Fixture loading: links come from the fixture itself
+    if update_fields is not None and 'genres' not in update_fields:
+        return
+    Genre.sync_movies([(instance.pk, instance.genres)])
+
+
+def update_movie_rating_stats(sender, instance, raw=False, **kwargs):
+    """Refresh the stored average and count of a rating's movie."""
+    if raw:
+        return  # Fixture loading: the movie rows carry their own stats
+    Movie.refresh_rating_stats([instance.movie_id])
+
+
+def restore_fts_triggers(sender, using, verbosity=1, stdout=None, **kwargs):
+    """After migrate, put back FTS triggers a table remake dropped."""
+    restored = fts.restore_triggers(connections[using])
+    if restored and verbosity and stdout is not None:
+        stdout.write(f"  Restored {', '.join(restored)} and rebuilt movie_fts\n")
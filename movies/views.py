@@ -23,7 +23,7 @@ from django.contrib.auth.views import LoginView
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import login
 from django.contrib import messages
-from django.db.models import Avg, Count, Q
+from django.db.models import Q
 from django.core.paginator import Paginator
 from django.conf import settings
 from django.urls import reverse_lazy
@@ -47,10 +47,9 @@ def home(request):
     Demonstrates: Collections (list, dict), f-strings, Django ORM
     """
     # Get featured movies (top rated with enough votes)
-    featured_movies = Movie.objects.annotate(
-        avg_rating=Avg('ratings__stars'),
-        num_ratings=Count('ratings')
-    ).filter(num_ratings__gte=1).order_by('-avg_rating')[:6]
+    featured_movies = Movie.objects.filter(
+        rating_count_cached__gte=1
+    ).order_by('-avg_rating_cached')[:6]
     
     # Get recent movies - list slicing
     recent_movies = list(Movie.objects.order_by('-created_at')[:6])
@@ -61,7 +60,7 @@ def home(request):
     
     for movie in all_movies:
         # For loop over movies
-        genres = movie.get_genres_list()  # list of genres
+        genres = movie.genres_list  # list of genres
         for genre in genres:
             # Nested for loop
             if genre in genre_counts:
@@ -114,10 +113,7 @@ class MovieListView(ListView):
         Demonstrates: If/else branching, string operations,
                      Django ORM filtering, collections (Q objects list)
         """
-        queryset = Movie.objects.annotate(
-            avg_rating=Avg('ratings__stars'),
-            num_ratings=Count('ratings')
-        )
+        queryset = Movie.objects.all()
         
         # Get form data
         form = MovieSearchForm(self.request.GET)
@@ -166,11 +162,11 @@ class MovieListView(ListView):
             # Minimum rating filter
             if min_rating:
                 min_rating = float(min_rating)  # Casting to float
-                queryset = queryset.filter(avg_rating__gte=min_rating)
+                queryset = queryset.filter(avg_rating_cached__gte=min_rating)
             
             # Sorting with if/else for different sort options
             if sort_by == 'avg_rating':
-                queryset = queryset.order_by('-avg_rating', '-rating_count')
+                queryset = queryset.order_by('-avg_rating_cached', '-rating_count_cached')
             elif sort_by:
                 # Handle reverse sorting (prefix with -)
                 if sort_by.startswith('-'):
@@ -470,8 +466,6 @@ def genre_movies(request, genre):
     # Filter movies containing this genre
     movies = Movie.objects.filter(
         genres__icontains=genre_normalized
-    ).annotate(
-        avg_rating=Avg('ratings__stars')
     ).order_by('-popularity')
     
     # Pagination
@@ -510,7 +504,7 @@ def search_api(request):
             'id': movie.pk,
             'title': movie.title,
             'year': movie.year,
-            'genres': movie.get_genres_list(),
+            'genres': movie.genres_list,
             'display': f"{movie.title} ({movie.year})",  # f-string
         }
         for movie in movies
@@ -552,7 +546,7 @@ def user_ratings(request):
         # Count by genre using for loop
         genre_counts = {}
         for rating in ratings:
-            for genre in rating.movie.get_genres_list():
+            for genre in rating.movie.genres_list:
                 genre_counts[genre] = genre_counts.get(genre, 0) + 1
         
         # Sort genres using lambda
@@ -590,7 +584,7 @@ def all_genres(request):
     
     # For loop over movies
     for movie in movies:
-        genres = movie.get_genres_list()  # list
+        genres = movie.genres_list  # list
         avg = movie.average_rating
         
         # Nested loop over genres
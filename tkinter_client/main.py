@@ -39,7 +39,6 @@ from typing import List, Dict, Optional, Callable
 # Django imports
 from movies.models import Movie, Rating, UserProfile
 from django.contrib.auth.models import User
-from django.db.models import Avg, Count
 
 
 class CineSenseApp:
@@ -336,20 +335,17 @@ class CineSenseApp:
         genre_filter = self.genre_var.get()
         
         # Query movies
-        movies = Movie.objects.annotate(
-            avg_rating=Avg('ratings__stars'),
-            num_ratings=Count('ratings')
-        )
+        movies = Movie.objects.all()
         
         # Apply filter if not 'All'
         if genre_filter != 'All':
             movies = movies.filter(genres__icontains=genre_filter)
         
-        movies = movies.order_by('-avg_rating', '-rating_count')[:100]
+        movies = movies.order_by('-avg_rating_cached', '-rating_count_cached')[:100]
         
         # Insert data
         for movie in movies:
-            avg = movie.avg_rating or 0
+            avg = movie.average_rating
             rating_str = f"{avg:.2f}" if avg > 0 else "-"
             
             self.movie_tree.insert('', tk.END, values=(
@@ -536,7 +532,7 @@ class CineSenseApp:
             Q(title__icontains=query) |
             Q(genres__icontains=query) |
             Q(overview__icontains=query)
-        ).annotate(avg_rating=Avg('ratings__stars'))[:20]
+        )[:20]
         
         # Display results
         if not movies:
@@ -557,7 +553,7 @@ class CineSenseApp:
             frame = ttk.Frame(self.results_frame)
             frame.pack(fill=tk.X, pady=2)
             
-            avg = movie.avg_rating or 0
+            avg = movie.average_rating
             rating_str = f"★{avg:.1f}" if avg > 0 else "No ratings"
             
             # f-string for display
@@ -809,7 +805,7 @@ class CineSenseApp:
         # Count genres using dict
         genre_counts = {}
         for movie in Movie.objects.all():
-            for genre in movie.get_genres_list():
+            for genre in movie.genres_list:
                 genre_counts[genre] = genre_counts.get(genre, 0) + 1
         
         # Sort using lambda